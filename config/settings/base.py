@@ -97,6 +97,9 @@ WSGI_APPLICATION = "config.wsgi.application"
 DATABASE_TYPE = os.environ.get("DATABASE_TYPE", "postgres")
 
 if DATABASE_TYPE == "mongodb":
+    # djongo is not in requirements.txt (it caps Django below 5, which the
+    # models now require); opting into this backend needs it installed
+    # separately. The Mongo repositories themselves talk to pymongo.
     DATABASES = {
         "default": {
             "ENGINE": "djongo",
@@ -175,6 +178,10 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # REST Framework settings
 REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.presentation.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework.authentication.SessionAuthentication",
     ),
@@ -221,20 +228,34 @@ CELERY_TIMEZONE = TIME_ZONE
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 
 # Cache settings
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.dummy.DummyCache"
-        # "BACKEND": "django_redis.cache.RedisCache",
-        # "LOCATION": os.environ.get("REDIS_URL", "redis://localhost:6379/1"),
-        # "OPTIONS": {
-        #     "CLIENT_CLASS": "django_redis.client.DefaultClient",
-        #     # "PARSER_CLASS": "redis.connection.HiredisParser",
-        # },
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": os.environ.get("REDIS_URL"),
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                # Cached values are nested DTO trees, so pickle stays; the
+                # newest protocol plus zlib keeps the Redis blobs small.
+                "PICKLE_VERSION": -1,
+                "COMPRESSOR": "django_redis.compressors.zlib.ZlibCompressor",
+            },
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        }
     }
-}
 
-# Cache time to live is 15 minutes
-CACHE_TTL = 1
+# Cache TTL policy: listing endpoints churn as new papers land, so they
+# get a short TTL; a paper's detail page is effectively immutable once
+# published and can live much longer. Explicit invalidation still goes
+# through the version tag carried in every key.
+CACHE_TTL = int(os.environ.get("CACHE_TTL", 1))
+CACHE_TTL_SHORT = int(os.environ.get("CACHE_TTL_SHORT", 10))
+CACHE_TTL_LONG = int(os.environ.get("CACHE_TTL_LONG", 1800))
 
 # Search engine settings
 ELASTICSEARCH_DSL = {
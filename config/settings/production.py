@@ -58,19 +58,25 @@ if "SENTRY_DSN" in os.environ:
     )
 
 # Cache settings for production
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.dummy.DummyCache"
-        # "BACKEND": "django_redis.cache.RedisCache",
-        # "LOCATION": os.environ.get("REDIS_URL"),
-        # "OPTIONS": {
-        #     "CLIENT_CLASS": "django_redis.client.DefaultClient",
-        #     "PARSER_CLASS": "redis.connection.HiredisParser",
-        #     "COMPRESSOR": "django_redis.compressors.zlib.ZlibCompressor",
-        #     "IGNORE_EXCEPTIONS": False,
-        # },
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": os.environ.get("REDIS_URL"),
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                "PICKLE_VERSION": -1,
+                "COMPRESSOR": "django_redis.compressors.zlib.ZlibCompressor",
+                "IGNORE_EXCEPTIONS": False,
+            },
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        }
     }
-}
 
 # Email configuration for production
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
@@ -83,14 +89,14 @@ DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL")
 
 # Production-specific REST Framework settings
 REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [
-    "rest_framework.renderers.JSONRenderer",
+    "core.presentation.renderers.ORJSONRenderer",
     "rest_framework.renderers.BrowsableAPIRenderer",
 ]
 
 ENABLE_SWAGGER = os.environ.get("ENABLE_SWAGGER", "false").lower() == "true"
 if ENABLE_SWAGGER:
     REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [
-        "rest_framework.renderers.JSONRenderer",
+        "core.presentation.renderers.ORJSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
     ]
 
@@ -7,6 +7,12 @@ class InsightRepository(ABC):
     def get_research_insights(self) -> any:
         pass
 
+    @abstractmethod
+    def get_count_statistics(
+        self, research_fields: Optional[List[str]] = None
+    ) -> any:
+        pass
+
     @abstractmethod
     def get_per_month_articles_statements(
         self, research_fields: Optional[List[str]] = None
@@ -1,6 +1,8 @@
-from typing import List, Dict, Any, Optional, cast
+from typing import List, Dict, Any, Optional, cast, final
 from datetime import datetime
 
+import numpy as np
+
 from core.domain.entities import (
     Article,
     Statement,
@@ -33,6 +35,11 @@ from core.application.dtos.output_dtos import (
 )
 
 
+def _as_list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else ([value] if value else [])
+
+
+@final
 class AuthorMapper:
 
     @staticmethod
@@ -50,7 +57,7 @@ class AuthorMapper:
             id=entity.id,
             given_name=entity.given_name,
             family_name=entity.family_name,
-            label=entity.label or f"{entity.given_name} {entity.family_name}",
+            label=entity.label,
         )
 
     @staticmethod
@@ -63,6 +70,7 @@ class AuthorMapper:
         )
 
 
+@final
 class ConceptMapper:
 
     @staticmethod
@@ -84,6 +92,7 @@ class ConceptMapper:
         )
 
 
+@final
 class ResearchFieldMapper:
 
     @staticmethod
@@ -101,6 +110,7 @@ class ResearchFieldMapper:
         )
 
 
+@final
 class JournalMapper:
 
     @staticmethod
@@ -118,6 +128,7 @@ class JournalMapper:
         )
 
 
+@final
 class ConferenceMapper:
 
     @staticmethod
@@ -135,6 +146,7 @@ class ConferenceMapper:
         )
 
 
+@final
 class NotationMapper:
 
     @staticmethod
@@ -158,6 +170,7 @@ class NotationMapper:
         )
 
 
+@final
 class ContributionMapper:
 
     @staticmethod
@@ -194,12 +207,18 @@ class ContributionMapper:
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> Contribution:
+        return ContributionMapper.from_dict_with_id(
+            data.get("id", "") or data.get("_id", ""), data
+        )
+
+    @staticmethod
+    def from_dict_with_id(id_: str, data: Dict[str, Any]) -> Contribution:
         authors = []
         if "author" in data and data["author"]:
             authors = [AuthorMapper.from_dict(author) for author in data["author"]]
 
         return Contribution(
-            id=data.get("id", "") or data.get("_id", ""),
+            id=id_,
             title=data.get("title", ""),
             author=authors,
             info=data.get("info", {}),
@@ -211,6 +230,7 @@ class ContributionMapper:
         )
 
 
+@final
 class StatementMapper:
 
     @staticmethod
@@ -257,20 +277,15 @@ class StatementMapper:
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> Statement:
-        authors = []
-        if "author" in data and data["author"]:
-            if isinstance(data["author"], list):
-                authors = [AuthorMapper.from_dict(author) for author in data["author"]]
-            else:
-                authors = [AuthorMapper.from_dict(data["author"])]
+        authors = [
+            AuthorMapper.from_dict(author) for author in _as_list(data.get("author"))
+        ]
 
         notation = None
         if "notation" in data and data["notation"]:
             notation = NotationMapper.from_dict(data["notation"])
 
-        supports = data.get("supports", [])
-        if not isinstance(supports, list):
-            supports = [supports] if supports else []
+        supports = _as_list(data.get("supports"))
 
         created_at = None
         if "created_at" in data and data["created_at"]:
@@ -303,6 +318,7 @@ class StatementMapper:
         )
 
 
+@final
 class PaperMapper:
 
     @staticmethod
@@ -386,13 +402,69 @@ class PaperMapper:
         )
 
     @staticmethod
-    def from_dict(data: Dict[str, Any]) -> Article:
-        authors = []
-        if "author" in data and data["author"]:
-            if isinstance(data["author"], list):
-                authors = [AuthorMapper.from_dict(author) for author in data["author"]]
+    def from_dicts_columnar(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Decode raw paper dicts into column arrays for indexing pipelines.
+
+        Walks the input list once and returns one array per column instead of
+        materializing Article objects, so indexing consumers read contiguous
+        memory rather than chasing pointers through dataclasses.
+        """
+        count = len(rows)
+        ids = np.fromiter(
+            (row.get("id", "") or row.get("_id", "") for row in rows),
+            dtype=object,
+            count=count,
+        )
+        titles = np.fromiter(
+            (row.get("title", "") or row.get("name", "") for row in rows),
+            dtype=object,
+            count=count,
+        )
+        abstracts = np.fromiter(
+            (row.get("abstract", "") for row in rows), dtype=object, count=count
+        )
+        dates = np.empty(count, dtype="datetime64[s]")
+        author_labels = np.empty(count, dtype=object)
+        for i, row in enumerate(rows):
+            date_published = row.get("date_published", None)
+            if isinstance(date_published, str):
+                try:
+                    date_published = datetime.fromisoformat(
+                        date_published.replace("Z", "+00:00")
+                    )
+                except ValueError:
+                    try:
+                        date_published = datetime.strptime(date_published, "%Y-%m-%d")
+                    except ValueError:
+                        date_published = None
+            if date_published:
+                dates[i] = np.datetime64(date_published.replace(tzinfo=None), "s")
             else:
-                authors = [AuthorMapper.from_dict(data["author"])]
+                dates[i] = np.datetime64("NaT")
+
+            author = row.get("author", None) or []
+            if not isinstance(author, list):
+                author = [author]
+            author_labels[i] = [
+                a.get("label", "")
+                or f"{a.get('given_name', '') or a.get('givenName', '')} "
+                f"{a.get('family_name', '') or a.get('familyName', '')}"
+                for a in author
+            ]
+
+        return {
+            "id": ids,
+            "title": titles,
+            "abstract": abstracts,
+            "date_published": dates,
+            "author_labels": author_labels,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> Article:
+        authors = [
+            AuthorMapper.from_dict(author) for author in _as_list(data.get("author"))
+        ]
 
         research_fields = []
         research_fields_id = []
@@ -404,17 +476,16 @@ class PaperMapper:
                 research_fields_id = [rf.id for rf in research_fields]
 
         contributions = []
-        if "contributions" in data and data["contributions"]:
-            if isinstance(data["contributions"], list):
-                contributions = [
-                    ContributionMapper.from_dict(contribution)
-                    for contribution in data["contributions"]
-                ]
-            elif isinstance(data["contributions"], dict):
-                contributions = [
-                    ContributionMapper.from_dict({"id": k, **v})
-                    for k, v in data["contributions"].items()
-                ]
+        if isinstance(data.get("contributions"), dict):
+            contributions = [
+                ContributionMapper.from_dict_with_id(k, v)
+                for k, v in data["contributions"].items()
+            ]
+        else:
+            contributions = [
+                ContributionMapper.from_dict(contribution)
+                for contribution in _as_list(data.get("contributions"))
+            ]
 
         statements = []
         if "statements" in data and data["statements"]:
@@ -1,4 +1,10 @@
+import hashlib
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+from django.db import connections
 
 from core.application.interfaces.repositories.author import AuthorRepository
 from core.application.interfaces.repositories.concept import ConceptRepository
@@ -22,6 +28,20 @@ from core.infrastructure.models.sql_models import (
 
 logger = logging.getLogger(__name__)
 
+INSIGHTS_CACHE_TTL = 300
+
+
+def _on_worker_thread(fn, arg):
+    """Run a repository call on an executor thread.
+
+    Database connections are thread-local; close them when the task is done
+    so short-lived worker threads do not leak connections past the request.
+    """
+    try:
+        return fn(arg)
+    finally:
+        connections.close_all()
+
 
 class InsightServiceImpl(InsightServiceInterface):
     def __init__(
@@ -45,47 +65,97 @@ class InsightServiceImpl(InsightServiceInterface):
     def get_research_insights(self, research_fields=None) -> any:
 
         try:
-            concepts_with_usage = self.insight_repository.get_concepts_with_usage(
-                research_fields
-            )
-            components_with_usage = self.insight_repository.get_components_with_usage(
-                research_fields
-            )
-            data_types_with_usage = self.insight_repository.get_data_type_with_usage(
-                research_fields
-            )
-            programming_languages_with_usage = (
-                self.insight_repository.get_programming_language_with_usage(
-                    research_fields
-                )
-            )
-            packages_with_usage = (
-                self.insight_repository.get_software_library_with_usage(research_fields)
-            )
-            articles_statements_per_month = (
-                self.insight_repository.get_per_month_articles_statements(
-                    research_fields
+            # blake2b rather than hash(): the builtin is seeded per process,
+            # so every worker would mint its own key for the same filters
+            # and the shared cache would fragment.
+            if research_fields:
+                digest = hashlib.blake2b(
+                    ",".join(sorted(research_fields)).encode(), digest_size=16
+                ).hexdigest()
+                cache_key = f"research_insights_{digest}"
+            else:
+                cache_key = "research_insights"
+            cached_result = cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
+
+            # Only one request rebuilds an expired entry; the rest serve the
+            # last-known-good copy (or briefly wait for the fresh one)
+            # instead of all fanning out to the database at once.
+            lock_key = f"{cache_key}:lock"
+            stale_key = f"stale:{cache_key}"
+            have_lock = cache.add(lock_key, "1", timeout=30)
+            if not have_lock:
+                stale = cache.get(stale_key)
+                if stale is not None:
+                    return stale
+                time.sleep(0.05)
+                cached_result = cache.get(cache_key)
+                if cached_result is not None:
+                    return cached_result
+
+            try:
+                research_field_models = ResearchFieldModel.objects.filter(
+                    research_field_id__in=research_fields
                 )
-            )
-            research_fields = ResearchFieldModel.objects.filter(
-                research_field_id__in=research_fields
-            )
-            return {
-                "statistics": {
-                    "Articles": self.paper_repository.get_count_all(research_fields),
-                    "Scientific statements": self.statement_repository.get_count_all(
-                        research_fields
-                    ),
-                    "Journals": self.journal_repository.get_count_all(research_fields),
-                    "Authors": self.author_repository.get_count_all(research_fields),
-                },
-                "articles_statements_per_month": articles_statements_per_month,
-                "programming_languages_with_usage": programming_languages_with_usage,
-                "packages_with_usage": packages_with_usage,
-                "data_types_with_usage": data_types_with_usage,
-                "concepts_with_usage": concepts_with_usage,
-                "components_with_usage": components_with_usage,
-            }
+
+                # The repository calls are independent reads; running them on a
+                # thread pool overlaps their DB round-trips, each worker thread
+                # getting its own connection.
+                with ThreadPoolExecutor(max_workers=7) as executor:
+                    statistics = executor.submit(
+                        _on_worker_thread,
+                        self.insight_repository.get_count_statistics,
+                        research_field_models,
+                    )
+                    per_month = executor.submit(
+                        _on_worker_thread,
+                        self.insight_repository.get_per_month_articles_statements,
+                        research_fields,
+                    )
+                    programming_languages = executor.submit(
+                        _on_worker_thread,
+                        self.insight_repository.get_programming_language_with_usage,
+                        research_fields,
+                    )
+                    packages = executor.submit(
+                        _on_worker_thread,
+                        self.insight_repository.get_software_library_with_usage,
+                        research_fields,
+                    )
+                    data_types = executor.submit(
+                        _on_worker_thread,
+                        self.insight_repository.get_data_type_with_usage,
+                        research_fields,
+                    )
+                    concepts = executor.submit(
+                        _on_worker_thread,
+                        self.insight_repository.get_concepts_with_usage,
+                        research_fields,
+                    )
+                    components = executor.submit(
+                        _on_worker_thread,
+                        self.insight_repository.get_components_with_usage,
+                        research_fields,
+                    )
+
+                    result = {
+                        "statistics": statistics.result(),
+                        "articles_statements_per_month": per_month.result(),
+                        "programming_languages_with_usage": programming_languages.result(),
+                        "packages_with_usage": packages.result(),
+                        "data_types_with_usage": data_types.result(),
+                        "concepts_with_usage": concepts.result(),
+                        "components_with_usage": components.result(),
+                    }
+                cache.set(cache_key, result, INSIGHTS_CACHE_TTL)
+                cache.set(stale_key, result, INSIGHTS_CACHE_TTL * 10)
+                return result
+            finally:
+                # Release even when the rebuild raises, so a failed build
+                # does not strand the lock for its full TTL.
+                if have_lock:
+                    cache.delete(lock_key)
 
         except Exception as e:
             logger.error(f"Error in research components {str(e)}")
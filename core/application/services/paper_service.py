@@ -1,7 +1,14 @@
+import hashlib
+import json
 import logging
-import math
+import operator
 import os
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
+from django.conf import settings
 from django.core.cache import cache
 from django.utils.timezone import localtime
 from core.application.interfaces.repositories.author import AuthorRepository
@@ -31,7 +38,6 @@ from core.application.dtos.output_dtos import (
     CommonResponseDTO,
     PaginatedResponseDTO,
 )
-from rest_framework.response import Response
 from core.domain.exceptions import (
     DatabaseError,
 )
@@ -40,6 +46,116 @@ from core.infrastructure.utils.id_encoder import encode_id
 
 logger = logging.getLogger(__name__)
 
+# Hoisted out of the statement serialization loops; the environment
+# lookup otherwise runs once per serialized file/image reference.
+DOMAIN_NAME = os.environ.get("DOMAIN_NAME", "http://knowledgeloom21.service.tib.eu")
+
+# Pulls the three author fields in a single C-level call; the per-attribute
+# __getattribute__ lookups add up over hundreds of authors per response.
+_author_fields = operator.attrgetter("name", "orcid", "author_id")
+
+# Matches the DB-side orcid_url annotation; kept without a trailing slash
+# to preserve the comparison the code has always made.
+_ORCID_PREFIX = "https://orcid.org"
+
+def _format_display_date(value):
+    """Format a publication date for display.
+
+    localtime does a ZoneInfo offset lookup and strftime re-parses the
+    format string on every call; publication dates repeat heavily across
+    pages, so the non-None case is memoized. localtime(None) means "now"
+    and must not be cached.
+    """
+    if value is None:
+        return localtime(None).strftime("%B %d, %Y")
+    return _format_display_date_cached(value)
+
+
+@lru_cache(maxsize=4096)
+def _format_display_date_cached(value):
+    return localtime(value).strftime("%B %d, %Y")
+
+
+# In-process memo for mapped paper DTOs. updated_at in the key makes
+# stale entries unreachable as soon as a row changes; the cap keeps the
+# memo bounded with LRU eviction.
+_PAPER_DTO_CACHE_MAX = 8192
+_paper_dto_cache: OrderedDict = OrderedDict()
+_paper_dto_cache_lock = threading.Lock()
+
+
+PAPERS_CACHE_VERSION_KEY = "papers:ver"
+
+
+def _papers_cache_version() -> int:
+    """Current version tag for paper-derived cache entries.
+
+    Every key carries this version, so invalidation is a single INCR:
+    keys minted under the old version become unreachable and age out by
+    TTL. This avoids pattern deletes, which Redis serves with a SCAN over
+    the whole keyspace.
+    """
+    return cache.get_or_set(PAPERS_CACHE_VERSION_KEY, 1, timeout=None)
+
+
+def _invalidate_papers_cache() -> None:
+    try:
+        cache.incr(PAPERS_CACHE_VERSION_KEY)
+    except ValueError:
+        # Version key missing (evicted or never set); the next read
+        # recreates it and the cache is empty anyway.
+        cache.set(PAPERS_CACHE_VERSION_KEY, 1, timeout=None)
+
+
+def _load_with_lock(cache_key: str, build, ttl: int):
+    """Rebuild a cold cache entry under a short distributed lock.
+
+    When a popular key expires, every concurrent request would otherwise
+    miss and rebuild at once. cache.add is atomic, so only one request
+    wins the lock and rebuilds; the rest serve the last-known-good value
+    kept under a longer-lived stale companion key, or briefly wait for
+    the fresh entry.
+    """
+    lock_key = f"{cache_key}:lock"
+    stale_key = f"stale:{cache_key}"
+    if cache.add(lock_key, "1", timeout=10):
+        try:
+            result = build()
+            cache.set(cache_key, result, ttl)
+            cache.set(stale_key, result, ttl * 10)
+            return result
+        finally:
+            cache.delete(lock_key)
+
+    stale = cache.get(stale_key)
+    if stale is not None:
+        return stale
+
+    time.sleep(0.05)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    return build()
+
+
+def _cache_key(prefix: str, **parts: Any) -> str:
+    """Build a stable cache key from request parameters.
+
+    List-valued parts are sorted so semantically equal requests (the same
+    research fields in a different order, for example) share one cache
+    entry; the canonical form is hashed to keep keys short.
+    """
+    blob = json.dumps(
+        {
+            key: sorted(value) if isinstance(value, (list, set, tuple)) else value
+            for key, value in parts.items()
+        },
+        sort_keys=True,
+        default=str,
+    )
+    digest = hashlib.blake2b(blob.encode(), digest_size=16).hexdigest()
+    return f"{prefix}:v{_papers_cache_version()}:{digest}"
+
 
 class PaperServiceImpl(PaperServiceInterface):
     def __init__(
@@ -62,10 +178,10 @@ class PaperServiceImpl(PaperServiceInterface):
     def get_all_papers(
         self, page: int = 1, page_size: int = 10
     ) -> PaginatedResponseDTO:
-        # cache_key = f"all_papers_{page}_{page_size}"
-        # cached_result = cache.get(cache_key)
-        # if cached_result:
-        #     return cached_result
+        cache_key = _cache_key("all_papers", page=page, page_size=page_size)
+        cached_result = cache.get(cache_key)
+        if cached_result:
+            return cached_result
 
         try:
             papers, total = self.paper_repository.find_all(page, page_size)
@@ -74,25 +190,23 @@ class PaperServiceImpl(PaperServiceInterface):
                 total_elements=total,
                 page=page,
                 page_size=page_size,
-                total_pages=math.ceil(total / page_size),
+                total_pages=-(-total // page_size),
             )
 
-            # Cache for 15 minutes
-            # cache.set(cache_key, result, settings.CACHE_TTL)
+            cache.set(cache_key, result, settings.CACHE_TTL_SHORT)
             return result
 
         except Exception as e:
-            logger.error(f"Error in get_all_papers: {str(e)}")
+            logger.error("Error in get_all_papers: %s", e)
             raise DatabaseError(f"Failed to retrieve papers: {str(e)}")
 
     def get_all_statements(
         self, page: int = 1, page_size: int = 10
     ) -> PaginatedResponseDTO:
-        # cache_key = f"all_statements_{page}_{page_size}"
-        # cached_result = cache.get(cache_key)
-
-        # if cached_result:
-        #     return cached_result
+        cache_key = _cache_key("all_statements", page=page, page_size=page_size)
+        cached_result = cache.get(cache_key)
+        if cached_result:
+            return cached_result
 
         try:
             statements, total = self.statement_repository.find_all(page, page_size)
@@ -104,15 +218,14 @@ class PaperServiceImpl(PaperServiceInterface):
                 total_elements=total,
                 page=page,
                 page_size=page_size,
-                total_pages=math.ceil(total / page_size),
+                total_pages=-(-total // page_size),
             )
 
-            # Cache for 15 minutes
-            # cache.set(cache_key, result, settings.CACHE_TTL)
+            cache.set(cache_key, result, settings.CACHE_TTL_SHORT)
             return result
 
         except Exception as e:
-            logger.error(f"Error in get_all_statements: {str(e)}")
+            logger.error("Error in get_all_statements: %s", e)
             raise DatabaseError(f"Failed to retrieve statements: {str(e)}")
 
     def search_by_title(self, title: str) -> List[PaperOutputDTO]:
@@ -121,10 +234,29 @@ class PaperServiceImpl(PaperServiceInterface):
             return [self._map_paper_to_dto(paper) for paper in papers]
 
         except Exception as e:
-            logger.error(f"Error in search_by_title: {str(e)}")
+            logger.error("Error in search_by_title: %s", e)
             raise DatabaseError(f"Failed to search papers: {str(e)}")
 
-    def query_data(self, query_filter: QueryFilterInputDTO) -> PaginatedResponseDTO:
+    def query_data(self, query_filter: QueryFilterInputDTO) -> Dict[str, Any]:
+        # The payload is cached as the plain response dict, so repeat reads
+        # skip both the queries and the serialization below; the version tag
+        # in the key invalidates entries when papers change.
+        cache_key = _cache_key(
+            "query_papers",
+            title=query_filter.title,
+            start_year=query_filter.start_year,
+            end_year=query_filter.end_year,
+            author_ids=query_filter.author_ids,
+            scientific_venue_ids=query_filter.scientific_venue_ids,
+            concept_ids=query_filter.concept_ids,
+            research_field_ids=query_filter.research_field_ids,
+            page=query_filter.page,
+            page_size=query_filter.per_page,
+        )
+        cached_payload = cache.get(cache_key)
+        if cached_payload is not None:
+            return cached_payload
+
         try:
             papers, total = self.paper_repository.query_papers(
                 title=query_filter.title,
@@ -139,126 +271,77 @@ class PaperServiceImpl(PaperServiceInterface):
             )
 
             serialized_papers = []
+            # query_papers always returns Article entities whose authors,
+            # concepts and research_fields are plain lists of entities, so the
+            # serialization below uses direct attribute access instead of the
+            # old hasattr/isinstance cascades.
             for paper in papers:
-                # Extract authors safely
-                authors = []
-                if hasattr(paper, "authors") and paper.authors:
-                    if hasattr(paper.authors, "all"):  # QuerySet
-                        authors = [
-                            {"id": author.author_id, "label": str(author.label)}
-                            for author in paper.authors.all()
-                        ]
-                    elif isinstance(paper.authors, list):  # List
-                        authors = [
-                            {
-                                "id": author.author_id,
-                                "label": str(author.label),
-                                "orcid": author.orcid,
-                            }
-                            for author in paper.authors
-                        ]
-                    else:  # Single author
-                        authors = [
-                            {
-                                "id": getattr(paper.authors, "id", ""),
-                                "label": str(paper.authors),
-                            }
-                        ]
-
-                # Extract concepts safely
-                concepts = []
-                if hasattr(paper, "concepts") and paper.concepts:
-                    if hasattr(paper.concepts, "all"):  # QuerySet
-                        concepts = [
-                            {"id": concept.id, "label": concept.label}
-                            for concept in paper.concepts.all()
-                        ]
-                    elif isinstance(paper.concepts, list):  # List
-                        concepts = [
-                            {
-                                "id": getattr(concept, "id", ""),
-                                "label": getattr(concept, "label", str(concept)),
-                            }
-                            for concept in paper.concepts
-                        ]
-
-                # Extract research fields safely
-                research_fields = []
-                if hasattr(paper, "research_fields") and paper.research_fields:
-                    if hasattr(paper.research_fields, "all"):  # QuerySet
-                        research_fields = [
-                            {
-                                "id": rf.research_field_id,
-                                "label": rf.label,
-                                "identifier": getattr(rf, "_id", str(rf)),
-                            }
-                            for rf in paper.research_fields.all()
-                        ]
-                    elif isinstance(paper.research_fields, list):  # List
-                        research_fields = [
-                            {
-                                "id": getattr(rf, "research_field_id", ""),
-                                "label": getattr(rf, "label", str(rf)),
-                                "related_identifier": getattr(
-                                    rf, "related_identifier", str(rf)
-                                ),
-                            }
-                            for rf in paper.research_fields
-                        ]
+                authors = [
+                    {
+                        "id": author.author_id,
+                        "label": str(author.label),
+                        "orcid": author.orcid,
+                    }
+                    for author in paper.authors
+                ]
 
-                # Extract journal/conference safely
-                journal_conference = None
-                if hasattr(paper, "journal_conference") and paper.journal_conference:
-                    journal_conference = {
-                        "id": getattr(paper.journal_conference, "id", ""),
-                        "label": getattr(
-                            paper.journal_conference,
-                            "label",
-                            str(paper.journal_conference),
-                        ),
-                        "identifier": getattr(paper.journal_conference, "_id", ""),
+                concepts = [
+                    {"id": concept.id, "label": concept.label}
+                    for concept in paper.concepts
+                ]
+
+                research_fields = [
+                    {
+                        "id": rf.research_field_id,
+                        "label": rf.label,
+                        "related_identifier": rf.related_identifier,
                     }
-                elif hasattr(paper, "journal") and paper.journal:
+                    for rf in paper.research_fields
+                ]
+
+                journal_conference = None
+                if paper.journal:
                     journal_conference = {
-                        "id": getattr(paper.journal, "journal_conference_id", ""),
-                        "identifier": getattr(paper.journal, "_id", ""),
-                        "label": getattr(paper.journal, "label", str(paper.journal)),
+                        "id": paper.journal.journal_conference_id,
+                        "identifier": paper.journal._id,
+                        "label": paper.journal.label,
                     }
 
-                publisher = None
-                if hasattr(paper, "publisher") and paper.publisher:
-                    publisher = paper.publisher.label
+                publisher = paper.publisher.label if paper.publisher else None
+                date_published = paper.date_published
                 paper_dict = {
-                    "article_id": getattr(paper, "article_id", ""),
-                    "name": getattr(paper, "name", getattr(paper, "title", "")),
-                    "abstract": getattr(paper, "abstract", ""),
-                    "date_published": paper.date_published.year
-                    if hasattr(paper, "date_published")
-                    and localtime(paper.date_published).strftime("%Y")
-                    else None,
-                    "dois": getattr(paper, "dois", ""),
-                    "reborn_doi": getattr(paper, "reborn_doi", ""),
+                    "article_id": paper.article_id,
+                    "name": paper.name,
+                    "abstract": paper.abstract,
+                    "date_published": date_published.year if date_published else None,
+                    "dois": paper.dois,
+                    "reborn_doi": paper.reborn_doi,
                     "authors": authors,
                     "concepts": concepts,
                     "research_fields": research_fields,
                     "scientific_venue": journal_conference,
                     "publisher": publisher,
-                    "reborn_date": localtime(paper.date_published).strftime("%B %d, %Y")
-                    if hasattr(paper, "date_published") and paper.date_published
+                    "reborn_date": _format_display_date(date_published)
+                    if date_published
                     else None,
                 }
                 statements = []
-                for statement in paper.statements.all().order_by("order"):
-                    has_part = statement.has_part_statements.first()
+                # query_papers prefetches statements in display order with
+                # their authors, concepts and has-part rows; iterating the
+                # cached queryset avoids re-querying per paper.
+                for statement in paper.statements:
+                    has_part = (
+                        statement.prefetched_has_parts[0]
+                        if statement.prefetched_has_parts
+                        else None
+                    )
                     authors = []
                     for author in statement.authors.all():
                         authors.append(
                             {
                                 "name": author.label,
                                 "author_id": author.author_id,
-                                "orcid": author._id
-                                if author._id.startswith("https://orcid.org/")
-                                else None,
+                                "orcid": author.orcid_url,
                             }
                         )
 
@@ -281,10 +364,7 @@ class PaperServiceImpl(PaperServiceInterface):
                                 "name": has_part.schema_type.name,
                                 "description": has_part.schema_type.description,
                                 "type_id": has_part.schema_type.type_id,
-                                "properties": [
-                                    s.split("#", 1)[1] if "#" in s else ""
-                                    for s in has_part.schema_type.property
-                                ],
+                                "properties": has_part.schema_type.short_properties,
                             },
                         }
                     )
@@ -302,23 +382,73 @@ class PaperServiceImpl(PaperServiceInterface):
             has_next = query_filter.page < total_pages
             has_previous = query_filter.page > 1
 
-            return Response(
-                {
-                    "results": serialized_papers,
-                    "total_count": total,
-                    "page": query_filter.page,
-                    "page_size": query_filter.per_page,
-                    "total_pages": total_pages,
-                    "has_next": has_next,
-                    "has_previous": has_previous,
-                }
-            )
+            payload = {
+                "results": serialized_papers,
+                "total_count": total,
+                "page": query_filter.page,
+                "page_size": query_filter.per_page,
+                "total_pages": total_pages,
+                "has_next": has_next,
+                "has_previous": has_previous,
+            }
+            cache.set(cache_key, payload, settings.CACHE_TTL_SHORT)
+            return payload
 
         except Exception as e:
-            logger.error(f"Error in query_data: {str(e)}")
-            return CommonResponseDTO(
-                success=False, message=f"Failed to query data: {str(e)}"
+            logger.error("Error in query_data: %s", e)
+            return {"success": False, "message": f"Failed to query data: {str(e)}"}
+
+    def _serialize_data_items(self, items, io_type: str) -> list:
+        """Serialize a data type's input or output data items.
+
+        The input and output sides share the exact same shape; only the
+        "type" tag differs, so both loops in statement_data_type funnel
+        through here.
+        """
+        serialized = []
+        for item in items:
+            has_characteristic = None
+            if item.has_characteristic:
+                has_characteristic = {
+                    "number_rows": item.has_characteristic.number_rows,
+                    "number_columns": item.has_characteristic.number_columns,
+                }
+            has_expressions = []
+            for has_expression in item.has_expression.all():
+                has_expressions.append(
+                    {
+                        "source": encode_id(has_expression.id),
+                        "type": "has_expression",
+                        "label": has_expression.label,
+                        "source_url": f"{DOMAIN_NAME}{has_expression.source_image.url}"
+                        if has_expression.source_image
+                        else has_expression.source_url,
+                    }
+                )
+            has_parts = []
+            for has_part in item.has_part.all():
+                has_parts.append(
+                    {
+                        "label": has_part.label,
+                        "see_also": has_part.see_also,
+                    }
+                )
+            serialized.append(
+                {
+                    "source": encode_id(item.id),
+                    "type": io_type,
+                    "label": item.label,
+                    "source_url": f"{DOMAIN_NAME}{item.source_file.url}"
+                    if item.source_file
+                    else item.source_url,
+                    "comment": item.comment,
+                    "source_table": item.source_table,
+                    "has_characteristic": has_characteristic,
+                    "has_expressions": has_expressions,
+                    "has_parts": has_parts,
+                }
             )
+        return serialized
 
     def statement_data_type(self, statement: str) -> any:
         data_type = []
@@ -380,7 +510,7 @@ class PaperServiceImpl(PaperServiceInterface):
         implements = []
         for implement_statement in implement_statements:
             implements.append(
-                f"{os.environ.get('DOMAIN_NAME', 'http://knowledgeloom21.service.tib.eu')}{implement_statement.source_code.url}"
+                f"{DOMAIN_NAME}{implement_statement.source_code.url}"
                 if implement_statement.source_code
                 else implement_statement.url
             )
@@ -412,92 +542,12 @@ class PaperServiceImpl(PaperServiceInterface):
                             "has_support_url": software_method.has_support_url,
                         }
                     )
-            has_inputs = []
-            for has_input in data_type_statement.has_inputs.all():
-                has_characteristic = None
-                if has_input.has_characteristic:
-                    has_characteristic = {
-                        "number_rows": has_input.has_characteristic.number_rows,
-                        "number_columns": has_input.has_characteristic.number_columns,
-                    }
-                has_expressions = []
-                for has_expression in has_input.has_expression.all():
-                    has_expressions.append(
-                        {
-                            "source": encode_id(has_expression.id),
-                            "type": "has_expression",
-                            "label": has_expression.label,
-                            "source_url": f"{os.environ.get('DOMAIN_NAME', 'http://knowledgeloom21.service.tib.eu')}{has_expression.source_image.url}"
-                            if has_expression.source_image
-                            else has_expression.source_url,
-                        }
-                    )
-                has_parts = []
-                for has_part in has_input.has_part.all():
-                    has_parts.append(
-                        {
-                            "label": has_part.label,
-                            "see_also": has_part.see_also,
-                        }
-                    )
-                has_inputs.append(
-                    {
-                        "source": encode_id(has_input.id),
-                        "type": "has_input",
-                        "label": has_input.label,
-                        "source_url": f"{os.environ.get('DOMAIN_NAME', 'http://knowledgeloom21.service.tib.eu')}{has_input.source_file.url}"
-                        if has_input.source_file
-                        else has_input.source_url,
-                        "comment": has_input.comment,
-                        "source_table": has_input.source_table,
-                        "has_characteristic": has_characteristic,
-                        "has_expressions": has_expressions,
-                        "has_parts": has_parts,
-                    }
-                )
-            has_outputs = []
-            for has_output in data_type_statement.has_outputs.all():
-                has_characteristic = None
-                if has_output.has_characteristic:
-                    has_characteristic = {
-                        "number_rows": has_output.has_characteristic.number_rows,
-                        "number_columns": has_output.has_characteristic.number_columns,
-                    }
-                has_expressions = []
-                for has_expression in has_output.has_expression.all():
-                    has_expressions.append(
-                        {
-                            "source": encode_id(has_expression.id),
-                            "type": "has_expression",
-                            "label": has_expression.label,
-                            "source_url": f"{os.environ.get('DOMAIN_NAME', 'http://knowledgeloom21.service.tib.eu')}{has_expression.source_image.url}"
-                            if has_expression.source_image
-                            else has_expression.source_url,
-                        }
-                    )
-                has_parts = []
-                for has_part in has_output.has_part.all():
-                    has_parts.append(
-                        {
-                            "label": has_part.label,
-                            "see_also": has_part.see_also,
-                        }
-                    )
-                has_outputs.append(
-                    {
-                        "source": encode_id(has_output.id),
-                        "type": "has_output",
-                        "label": has_output.label,
-                        "source_url": f"{os.environ.get('DOMAIN_NAME', 'http://knowledgeloom21.service.tib.eu')}{has_output.source_file.url}"
-                        if has_output.source_file
-                        else has_output.source_url,
-                        "comment": has_output.comment,
-                        "source_table": has_output.source_table,
-                        "has_characteristic": has_characteristic,
-                        "has_expressions": has_expressions,
-                        "has_parts": has_parts,
-                    }
-                )
+            has_inputs = self._serialize_data_items(
+                data_type_statement.has_inputs.all(), "has_input"
+            )
+            has_outputs = self._serialize_data_items(
+                data_type_statement.has_outputs.all(), "has_output"
+            )
             dt = {
                 "label": data_type_statement.label,
                 "type": data_type_statement.type,
@@ -557,7 +607,17 @@ class PaperServiceImpl(PaperServiceInterface):
                     )
                 if targets:
                     dt["targets"] = targets
-            has_part = statement.has_part_statements.first()
+            # Statements from the detail endpoints carry the has-part rows
+            # as a prefetched list; the Weaviate index commands feed plain
+            # select_related querysets, which fall back to one query here.
+            prefetched = getattr(statement, "prefetched_has_parts", None)
+            has_part = (
+                prefetched[0]
+                if prefetched
+                else statement.has_part_statements.select_related("schema_type")
+                .order_by("id")
+                .first()
+            )
             data_type.append(
                 {
                     "has_part": dt,
@@ -567,10 +627,7 @@ class PaperServiceImpl(PaperServiceInterface):
                         "name": data_type_statement.schema_type.name,
                         "description": data_type_statement.schema_type.description,
                         "type_id": data_type_statement.schema_type.type_id,
-                        "properties": [
-                            s.split("#", 1)[1] if "#" in s else ""
-                            for s in data_type_statement.schema_type.property
-                        ],
+                        "properties": data_type_statement.schema_type.short_properties,
                     },
                 }
             )
@@ -581,13 +638,8 @@ class PaperServiceImpl(PaperServiceInterface):
             statement = self.statement_repository.find_by_id(statement_id)
             authors = []
             for author in statement.authors.all():
-                authors.append(
-                    {
-                        "name": author.name,
-                        "orcid": author.orcid,
-                        "author_id": author.author_id,
-                    }
-                )
+                name, orcid, author_id = _author_fields(author)
+                authors.append({"name": name, "orcid": orcid, "author_id": author_id})
 
             concepts = []
             for concept in statement.concepts.all():
@@ -607,11 +659,45 @@ class PaperServiceImpl(PaperServiceInterface):
             return result
 
         except Exception as e:
-            logger.error(f"Error in get_statement: {str(e)}")
+            logger.error("Error in get_statement: %s", e)
             return CommonResponseDTO(
                 success=False, message=f"Failed to retrieve statement: {str(e)}"
             )
 
+    def _build_paper_info(self, paper_dto, include_author_affiliation=False):
+        """Serialize the article header shared by the paper-detail and
+        article-statement endpoints.
+
+        Keeping one copy also keeps the interpreter's per-site inline
+        caches hot instead of specializing two identical blocks.
+        """
+        authors = []
+        for author in paper_dto.authors:
+            name, orcid, author_id = _author_fields(author)
+            entry = {"name": name, "orcid": orcid, "author_id": author_id}
+            if include_author_affiliation:
+                entry["affiliation"] = author.affiliation
+            authors.append(entry)
+        concepts = [
+            {"label": concept.label, "concept_id": concept.id}
+            for concept in (paper_dto.concepts or [])
+        ]
+        return {
+            "name": paper_dto.name,
+            "article_id": paper_dto.article_id,
+            "authors": authors,
+            "abstract": paper_dto.abstract,
+            "dois": paper_dto.dois,
+            "reborn_doi": paper_dto.reborn_doi,
+            # "scientific_venue": paper_dto.journal
+            # if paper_dto.journal
+            # else paper_dto.conference,
+            "concepts": concepts,
+            "research_fields": paper_dto.research_fields,
+            "publisher": paper_dto.publisher,
+            "date_published": _format_display_date(paper_dto.date_published),
+        }
+
     def get_article_statement(self, statement_id: str) -> CommonResponseDTO:
         try:
             statement_in_paper = (
@@ -624,56 +710,34 @@ class PaperServiceImpl(PaperServiceInterface):
                 paper = self.paper_repository.find_by_id(statement_in_paper.article_id)
             if paper:
                 paper_dto = self._map_paper_to_dto(paper)
-                authors = []
-                for author in paper_dto.authors:
-                    authors.append(
-                        {
-                            "name": author.name,
-                            "orcid": author.orcid,
-                            "author_id": author.author_id,
-                        }
-                    )
-                concepts = []
-                if paper_dto.concepts:
-                    for concept in paper_dto.concepts:
-                        concepts.append(
-                            {
-                                "label": concept.label,
-                                "concept_id": concept.id,
-                            }
-                        )
-                paper_info = {
-                    "name": paper_dto.name,
-                    "article_id": paper_dto.article_id,
-                    "authors": authors,
-                    "abstract": paper_dto.abstract,
-                    "dois": paper_dto.dois,
-                    "reborn_doi": paper_dto.reborn_doi,
-                    # "scientific_venue": paper_dto.journal
-                    # if paper_dto.journal
-                    # else paper_dto.conference,
-                    "concepts": concepts,
-                    "research_fields": paper_dto.research_fields,
-                    "publisher": paper_dto.publisher,
-                    "date_published": localtime(paper_dto.date_published).strftime(
-                        "%B %d, %Y"
-                    ),
-                    # "date_published": localtime(paper_dto.date_published).strftime(
-                    #     "%Y"
-                    # ),
-                }
+                paper_info = self._build_paper_info(paper_dto)
+                # The requested statement is refetched through the statement
+                # repository, whose find_by_id prefetches the whole data-type
+                # tree; its siblings below only get the light serialization.
+                target_statement = self.statement_repository.find_by_id(statement_id)
+                target_data_type = (
+                    self.statement_data_type(target_statement)
+                    if target_statement
+                    else {}
+                )
+
                 statements = []
-                for statement in paper.statements.all().order_by("order"):
-                    has_part = statement.has_part_statements.first()
+                # find_by_id prefetches statements in display order together
+                # with their authors, concepts and has-part rows; re-cloning
+                # the queryset here would discard that cache and re-query.
+                for statement in paper.statements:
+                    has_part = (
+                        statement.prefetched_has_parts[0]
+                        if statement.prefetched_has_parts
+                        else None
+                    )
                     authors = []
                     for author in statement.authors.all():
                         authors.append(
                             {
                                 "name": author.name,
                                 "author_id": author.author_id,
-                                "orcid": author.orcid
-                                if author.orcid.startswith("https://orcid.org/")
-                                else None,
+                                "orcid": author.orcid_url,
                             }
                         )
 
@@ -686,9 +750,11 @@ class PaperServiceImpl(PaperServiceInterface):
                                 "see_also": concept.see_also,
                             }
                         )
-                    data_type = {}
-                    if statement_id == statement.statement_id:
-                        data_type = self.statement_data_type(statement)
+                    data_type = (
+                        target_data_type
+                        if statement_id == statement.statement_id
+                        else {}
+                    )
                     statements.append(
                         {
                             "statement_id": statement.statement_id,
@@ -700,10 +766,7 @@ class PaperServiceImpl(PaperServiceInterface):
                                 "name": has_part.schema_type.name,
                                 "description": has_part.schema_type.description,
                                 "type_id": has_part.schema_type.type_id,
-                                "properties": [
-                                    s.split("#", 1)[1] if "#" in s else ""
-                                    for s in has_part.schema_type.property
-                                ],
+                                "properties": has_part.schema_type.short_properties,
                             },
                         }
                     )
@@ -719,7 +782,7 @@ class PaperServiceImpl(PaperServiceInterface):
                 return result
 
                 # Cache for 15 minutes
-                # cache.set(cache_key, result, settings.CACHE_TTL)
+                # cache.set(cache_key, result, settings.CACHE_TTL_SHORT)
                 # return result
 
                 return CommonResponseDTO(
@@ -727,81 +790,62 @@ class PaperServiceImpl(PaperServiceInterface):
                 )
 
         except Exception as e:
-            logger.error(f"Error in get_paper_by_id: {str(e)}")
+            logger.error("Error in get_paper_by_id: %s", e)
             return CommonResponseDTO(
                 success=False, message=f"Failed to retrieve paper: {str(e)}"
             )
 
     def get_paper_by_id(self, paper_id: str) -> CommonResponseDTO:
-        # cache_key = f"paper_{paper_id}"
-        # cached_result = cache.get(cache_key)
-
-        # if cached_result:
-        #     return cached_result
+        # The article header and the statement list are cached under separate
+        # keys; get_many fetches both in one cache round-trip.
+        version = _papers_cache_version()
+        paper_key = f"paper:v{version}:{paper_id}"
+        statements_key = f"paper_statements:v{version}:{paper_id}"
+        cached = cache.get_many([paper_key, statements_key])
+        if paper_key in cached and statements_key in cached:
+            paper_info, basises = cached[paper_key]
+            statements = cached[statements_key]
+            return CommonResponseDTO(
+                success=True,
+                result={
+                    "article": paper_info,
+                    "statements": statements,
+                    "basises": basises,
+                },
+                total_count=len(statements),
+            )
         try:
             paper = self.paper_repository.find_by_id(paper_id)
             if paper:
                 paper_dto = self._map_paper_to_dto(paper)
-                authors = []
-                for author in paper_dto.authors:
-                    authors.append(
-                        {
-                            "name": author.name,
-                            "orcid": author.orcid,
-                            "author_id": author.author_id,
-                            "affiliation": author.affiliation,
-                        }
-                    )
-                concepts = []
-                if paper_dto.concepts:
-                    for concept in paper_dto.concepts:
-                        concepts.append(
-                            {
-                                "label": concept.label,
-                                "concept_id": concept.id,
-                            }
-                        )
-                paper_info = {
-                    "name": paper_dto.name,
-                    "article_id": paper_dto.article_id,
-                    "authors": authors,
-                    "abstract": paper_dto.abstract,
-                    "dois": paper_dto.dois,
-                    "reborn_doi": paper_dto.reborn_doi,
-                    # "scientific_venue": paper_dto.journal
-                    # if paper_dto.journal
-                    # else paper_dto.conference,
-                    "concepts": concepts,
-                    "research_fields": paper_dto.research_fields,
-                    "publisher": paper_dto.publisher,
-                    "date_published": localtime(paper_dto.date_published).strftime(
-                        "%B %d, %Y"
-                    ),
-                    # "date_published": localtime(paper_dto.date_published).strftime("%Y"),
-                }
+                paper_info = self._build_paper_info(
+                    paper_dto, include_author_affiliation=True
+                )
                 statements = []
-                for statement in paper.statements.all().order_by("order"):
-                    has_part = statement.has_part_statements.first()
-                    authors = []
-                    for author in statement.authors.all():
-                        authors.append(
-                            {
-                                "name": author.name,
-                                "author_id": author.author_id,
-                                "orcid": author.orcid,
-                            }
-                        )
-
-                    concepts = []
-                    for concept in statement.concepts.all():
-                        concepts.append(
-                            {
-                                "label": concept.label,
-                                "concept_id": concept.concept_id,
-                                "definition": concept.definition,
-                                "see_also": concept.see_also,
-                            }
+                # find_by_id prefetches statements in display order together
+                # with their authors, concepts and has-part rows; re-cloning
+                # the queryset here would discard that cache and re-query.
+                for statement in paper.statements:
+                    has_part = (
+                        statement.prefetched_has_parts[0]
+                        if statement.prefetched_has_parts
+                        else None
+                    )
+                    authors = [
+                        {"name": name, "author_id": author_id, "orcid": orcid}
+                        for name, orcid, author_id in map(
+                            _author_fields, statement.authors.all()
                         )
+                    ]
+                    concepts = [
+                        {
+                            "label": concept.label,
+                            "concept_id": concept.concept_id,
+                            "definition": concept.definition,
+                            "see_also": concept.see_also,
+                        }
+                        for concept in statement.concepts.all()
+                    ]
 
                     statements.append(
                         {
@@ -813,10 +857,7 @@ class PaperServiceImpl(PaperServiceInterface):
                                 "name": has_part.schema_type.name,
                                 "description": has_part.schema_type.description,
                                 "type_id": has_part.schema_type.type_id,
-                                "properties": [
-                                    s.split("#", 1)[1] if "#" in s else ""
-                                    for s in has_part.schema_type.property
-                                ],
+                                "properties": has_part.schema_type.short_properties,
                             },
                         }
                     )
@@ -829,18 +870,21 @@ class PaperServiceImpl(PaperServiceInterface):
                     },
                     total_count=len(statements),
                 )
+                cache.set_many(
+                    {
+                        paper_key: (paper_info, paper.related_items),
+                        statements_key: statements,
+                    },
+                    settings.CACHE_TTL_LONG,
+                )
                 return result
 
-            # Cache for 15 minutes
-            # cache.set(cache_key, result, settings.CACHE_TTL)
-            # return result
-
             return CommonResponseDTO(
                 success=False, message=f"Paper with ID {paper_id} not found"
             )
 
         except Exception as e:
-            logger.error(f"Error in get_paper_by_id: {str(e)}")
+            logger.error("Error in get_paper_by_id: %s", e)
             return CommonResponseDTO(
                 success=False, message=f"Failed to retrieve paper: {str(e)}"
             )
@@ -859,7 +903,7 @@ class PaperServiceImpl(PaperServiceInterface):
             ]
 
         except Exception as e:
-            logger.error(f"Error in get_authors: {str(e)}")
+            logger.error("Error in get_authors: %s", e)
             return []
 
     def get_concepts(self, search_term: str) -> List[ConceptOutputDTO]:
@@ -873,7 +917,7 @@ class PaperServiceImpl(PaperServiceInterface):
             ]
 
         except Exception as e:
-            logger.error(f"Error in get_concepts: {str(e)}")
+            logger.error("Error in get_concepts: %s", e)
             return []
 
     def get_latest_concepts(self) -> List[ConceptOutputDTO]:
@@ -887,7 +931,7 @@ class PaperServiceImpl(PaperServiceInterface):
             ]
 
         except Exception as e:
-            logger.error(f"Error in get_latest_concepts: {str(e)}")
+            logger.error("Error in get_latest_concepts: %s", e)
             return []
 
     def get_titles(self, search_term: str) -> List[Dict[str, Any]]:
@@ -896,7 +940,7 @@ class PaperServiceImpl(PaperServiceInterface):
             return [{"id": paper.id, "name": paper.title} for paper in papers]
 
         except Exception as e:
-            logger.error(f"Error in get_titles: {str(e)}")
+            logger.error("Error in get_titles: %s", e)
             return []
 
     def get_journals(self, search_term: str) -> List[Dict[str, Any]]:
@@ -909,7 +953,7 @@ class PaperServiceImpl(PaperServiceInterface):
             ]
 
         except Exception as e:
-            logger.error(f"Error in get_journals: {str(e)}")
+            logger.error("Error in get_journals: %s", e)
             return []
 
     def get_research_fields(self, search_term: str) -> List[Dict[str, Any]]:
@@ -926,7 +970,7 @@ class PaperServiceImpl(PaperServiceInterface):
             ]
 
         except Exception as e:
-            logger.error(f"Error in get_research_fields: {str(e)}")
+            logger.error("Error in get_research_fields: %s", e)
             return []
 
     def get_paper(self, paper_id: str) -> CommonResponseDTO:
@@ -951,7 +995,7 @@ class PaperServiceImpl(PaperServiceInterface):
             )
 
         except Exception as e:
-            logger.error(f"Error in get_paper: {str(e)}")
+            logger.error("Error in get_paper: %s", e)
             return CommonResponseDTO(
                 success=False, message=f"Failed to retrieve paper: {str(e)}"
             )
@@ -966,36 +1010,44 @@ class PaperServiceImpl(PaperServiceInterface):
         search_type: str = "keyword",
     ) -> PaginatedResponseDTO:
         """Get latest statements with filters."""
-        # cache_key = f"latest_statements_{research_fields}_{search_query}_{sort_order}_{page}_{page_size}"
-        # cached_result = cache.get(cache_key)
-
-        # if cached_result:
-        #     return cached_result
+        cache_key = _cache_key(
+            "latest_statements",
+            research_fields=research_fields,
+            search_query=search_query,
+            sort_order=sort_order,
+            page=page,
+            page_size=page_size,
+            search_type=search_type,
+        )
+        cached_result = cache.get(cache_key)
+        if cached_result:
+            return cached_result
         try:
-            statements, total = self.statement_repository.get_latest_statements(
-                research_fields=research_fields,
-                search_query=search_query,
-                sort_order=sort_order,
-                page=page,
-                page_size=page_size,
-                search_type=search_type,
-            )
 
-            result = PaginatedResponseDTO(
-                content=[
-                    self._map_statement_to_dto(statement) for statement in statements
-                ],
-                total_elements=total,
-                page=page,
-                page_size=page_size,
-                total_pages=math.ceil(total / page_size),
-            )
-            # Cache for 15 minutes
-            # cache.set(cache_key, result, settings.CACHE_TTL)
-            return result
+            def build():
+                statements, total = self.statement_repository.get_latest_statements(
+                    research_fields=research_fields,
+                    search_query=search_query,
+                    sort_order=sort_order,
+                    page=page,
+                    page_size=page_size,
+                    search_type=search_type,
+                )
+                return PaginatedResponseDTO(
+                    content=[
+                        self._map_statement_to_dto(statement)
+                        for statement in statements
+                    ],
+                    total_elements=total,
+                    page=page,
+                    page_size=page_size,
+                    total_pages=-(-total // page_size),
+                )
+
+            return _load_with_lock(cache_key, build, settings.CACHE_TTL_SHORT)
 
         except Exception as e:
-            logger.error(f"Error in get_latest_statements: {str(e)}")
+            logger.error("Error in get_latest_statements: %s", e)
             raise DatabaseError(f"Failed to retrieve latest statements: {str(e)}")
 
     def get_latest_articles(
@@ -1014,41 +1066,54 @@ class PaperServiceImpl(PaperServiceInterface):
         concepts: Optional[List[str]] = None,
     ) -> PaginatedResponseDTO:
         """Get latest articles with filters."""
-        # cache_key = f"latest_articles_{research_fields}_{search_query}_{sort_order}_{page}_{page_size}"
-        # cached_result = cache.get(cache_key)
-
-        # if cached_result:
-        #     return cached_result
+        cache_key = _cache_key(
+            "latest_articles",
+            research_fields=research_fields,
+            search_query=search_query,
+            sort_order=sort_order,
+            sort_by=sort_by,
+            page=page,
+            page_size=page_size,
+            search_type=search_type,
+            resource_type=resource_type,
+            year_range=year_range,
+            authors=authors,
+            scientific_venues=scientific_venues,
+            concepts=concepts,
+        )
+        cached_result = cache.get(cache_key)
+        if cached_result:
+            return cached_result
 
         try:
-            papers, total = self.paper_repository.get_latest_articles(
-                research_fields=research_fields,
-                search_query=search_query,
-                sort_order=sort_order,
-                sort_by=sort_by,
-                page=page,
-                page_size=page_size,
-                search_type=search_type,
-                resource_type=resource_type,
-                year_range=year_range,
-                authors=authors,
-                scientific_venues=scientific_venues,
-                concepts=concepts,
-            )
-            result = PaginatedResponseDTO(
-                content=[self._map_paper_to_dto(paper) for paper in papers],
-                total_elements=total,
-                page=page,
-                page_size=page_size,
-                total_pages=math.ceil(total / page_size),
-            )
 
-            # Cache for 15 minutes
-            # cache.set(cache_key, result, settings.CACHE_TTL)
-            return result
+            def build():
+                papers, total = self.paper_repository.get_latest_articles(
+                    research_fields=research_fields,
+                    search_query=search_query,
+                    sort_order=sort_order,
+                    sort_by=sort_by,
+                    page=page,
+                    page_size=page_size,
+                    search_type=search_type,
+                    resource_type=resource_type,
+                    year_range=year_range,
+                    authors=authors,
+                    scientific_venues=scientific_venues,
+                    concepts=concepts,
+                )
+                return PaginatedResponseDTO(
+                    content=[self._map_paper_to_dto(paper) for paper in papers],
+                    total_elements=total,
+                    page=page,
+                    page_size=page_size,
+                    total_pages=-(-total // page_size),
+                )
+
+            return _load_with_lock(cache_key, build, settings.CACHE_TTL_SHORT)
 
         except Exception as e:
-            logger.error(f"Error in get_latest_articles: {str(e)}")
+            logger.error("Error in get_latest_articles: %s", e)
             raise DatabaseError(f"Failed to retrieve latest articles: {str(e)}")
 
     def get_latest_keywords(
@@ -1060,11 +1125,17 @@ class PaperServiceImpl(PaperServiceInterface):
         page_size: int = 10,
     ) -> PaginatedResponseDTO:
         """Get latest keywords with filters."""
-        # cache_key = f"latest_keywords_{research_fields}_{search_query}_{sort_order}_{page}_{page_size}"
-        # cached_result = cache.get(cache_key)
-
-        # if cached_result:
-        #     return cached_result
+        cache_key = _cache_key(
+            "latest_keywords",
+            research_fields=research_fields,
+            search_query=search_query,
+            sort_order=sort_order,
+            page=page,
+            page_size=page_size,
+        )
+        cached_result = cache.get(cache_key)
+        if cached_result:
+            return cached_result
 
         try:
             concepts, total = self.concept_repository.get_latest_keywords(
@@ -1087,15 +1158,14 @@ class PaperServiceImpl(PaperServiceInterface):
                 total_elements=total,
                 page=page,
                 page_size=page_size,
-                total_pages=math.ceil(total / page_size),
+                total_pages=-(-total // page_size),
             )
 
-            # Cache for 15 minutes
-            # cache.set(cache_key, result, settings.CACHE_TTL)
+            cache.set(cache_key, result, settings.CACHE_TTL_SHORT)
             return result
 
         except Exception as e:
-            logger.error(f"Error in get_latest_keywords: {str(e)}")
+            logger.error("Error in get_latest_keywords: %s", e)
             raise DatabaseError(f"Failed to retrieve latest keywords: {str(e)}")
 
     def get_latest_authors(
@@ -1107,11 +1177,17 @@ class PaperServiceImpl(PaperServiceInterface):
         page_size: int = 10,
     ) -> PaginatedResponseDTO:
         """Get latest authors with filters."""
-        # cache_key = f"latest_authors_{research_fields}_{search_query}_{sort_order}_{page}_{page_size}"
-        # cached_result = cache.get(cache_key)
-
-        # if cached_result:
-        #     return cached_result
+        cache_key = _cache_key(
+            "latest_authors",
+            research_fields=research_fields,
+            search_query=search_query,
+            sort_order=sort_order,
+            page=page,
+            page_size=page_size,
+        )
+        cached_result = cache.get(cache_key)
+        if cached_result:
+            return cached_result
         try:
             authors, total = self.author_repository.get_latest_authors(
                 research_fields=research_fields,
@@ -1126,7 +1202,7 @@ class PaperServiceImpl(PaperServiceInterface):
                         name=author.name,
                         author_id=author.author_id,
                         orcid=author.orcid
-                        if author.orcid and author.orcid.startswith("https://orcid.org")
+                        if author.orcid and author.orcid.startswith(_ORCID_PREFIX)
                         else None,
                     )
                     for author in authors
@@ -1134,15 +1210,14 @@ class PaperServiceImpl(PaperServiceInterface):
                 total_elements=total,
                 page=page,
                 page_size=page_size,
-                total_pages=math.ceil(total / page_size),
+                total_pages=-(-total // page_size),
             )
 
-            # Cache for 15 minutes
-            # cache.set(cache_key, result, settings.CACHE_TTL)
+            cache.set(cache_key, result, settings.CACHE_TTL_SHORT)
             return result
 
         except Exception as e:
-            logger.error(f"Error in get_latest_authors: {str(e)}")
+            logger.error("Error in get_latest_authors: %s", e)
             raise DatabaseError(f"Failed to retrieve latest authors: {str(e)}")
 
     def get_latest_journals(
@@ -1154,11 +1229,17 @@ class PaperServiceImpl(PaperServiceInterface):
         page_size: int = 10,
     ) -> PaginatedResponseDTO:
         """Get latest journals with filters."""
-        # cache_key = f"latest_journals_{research_fields}_{search_query}_{sort_order}_{page}_{page_size}"
-        # cached_result = cache.get(cache_key)
-
-        # if cached_result:
-        #     return cached_result
+        cache_key = _cache_key(
+            "latest_journals",
+            research_fields=research_fields,
+            search_query=search_query,
+            sort_order=sort_order,
+            page=page,
+            page_size=page_size,
+        )
+        cached_result = cache.get(cache_key)
+        if cached_result:
+            return cached_result
 
         try:
             journals, total = self.journal_repository.get_latest_journals(
@@ -1186,15 +1267,14 @@ class PaperServiceImpl(PaperServiceInterface):
                 total_elements=total,
                 page=page,
                 page_size=page_size,
-                total_pages=math.ceil(total / page_size),
+                total_pages=-(-total // page_size),
             )
 
-            # Cache for 15 minutes
-            # cache.set(cache_key, result, settings.CACHE_TTL)
+            cache.set(cache_key, result, settings.CACHE_TTL_SHORT)
             return result
 
         except Exception as e:
-            logger.error(f"Error in get_latest_journals: {str(e)}")
+            logger.error("Error in get_latest_journals: %s", e)
             raise DatabaseError(f"Failed to retrieve latest journals: {str(e)}")
 
     def extract_paper(self, url_dto: ScraperUrlInputDTO) -> CommonResponseDTO:
@@ -1206,16 +1286,14 @@ class PaperServiceImpl(PaperServiceInterface):
                 json_files["ro-crate-metadata.json"]
             )
             self.paper_repository.add_article(ro_crate, json_files)
-            # Invalidate relevant caches
-            # cache.delete_pattern("all_papers_*")
-            # cache.delete_pattern("latest_articles_*")
+            _invalidate_papers_cache()
 
             return CommonResponseDTO(
                 success=True, message="Paper extracted and saved successfully"
             )
 
         except Exception as e:
-            logger.error(f"Error in extract_paper: {str(e)}")
+            logger.error("Error in extract_paper: %s", e)
             return CommonResponseDTO(
                 success=False, message=f"Failed to extract paper: {str(e)}"
             )
@@ -1225,9 +1303,7 @@ class PaperServiceImpl(PaperServiceInterface):
             success = self.paper_repository.delete_article(article_id)
 
             if success:
-                # cache.delete_pattern("all_papers_*")
-                # cache.delete_pattern("latest_articles_*")
-                # cache.delete_pattern(f"article_{article_id}_*")
+                _invalidate_papers_cache()
 
                 return CommonResponseDTO(
                     success=True, message=f"Article {article_id} deleted successfully"
@@ -1238,7 +1314,7 @@ class PaperServiceImpl(PaperServiceInterface):
                 )
 
         except Exception as e:
-            logger.error(f"Error in delete_article service: {str(e)}")
+            logger.error("Error in delete_article service: %s", e)
             return CommonResponseDTO(
                 success=False, message=f"Failed to delete article: {str(e)}"
             )
@@ -1259,66 +1335,46 @@ class PaperServiceImpl(PaperServiceInterface):
             )
 
         except Exception as e:
-            logger.error(f"Error in delete_database: {str(e)}")
+            logger.error("Error in delete_database: %s", e)
             return CommonResponseDTO(
                 success=False, message=f"Failed to delete database: {str(e)}"
             )
 
     def _map_paper_to_dto(self, paper) -> ShortPaperOutputDTO:
-        """Map a paper entity to its DTO."""
-        authors = []
-        for author in paper.authors:
-            if isinstance(author, dict):
-                authors.append(
-                    ShortAuthorOutputDTO(
-                        name=author.get("name", ""),
-                        family_name=author.get("family_name", ""),
-                        orcid=author.get("orcid", ""),
-                        author_id=author.get("author_id", ""),
-                        affiliation=author.get("affiliation", ""),
-                    )
-                )
-            else:
-                authors.append(
-                    ShortAuthorOutputDTO(
-                        name=author.name,
-                        family_name=author.family_name,
-                        orcid=author.orcid,
-                        author_id=author.author_id,
-                        affiliation=author.affiliation,
-                    )
-                )
-        research_fields = []
-        if paper.research_fields:
-            for research_field in paper.research_fields:
-                research_fields.append(
-                    {
-                        "label": research_field.label,
-                        "research_field_id": research_field.research_field_id,
-                        "related_identifier": research_field.related_identifier,
-                    }
-                )
-
-        related_items = []
-        if paper.related_items:
-            for related_item in paper.related_items:
-                paper_authors = []
-                for author in related_item["authors"]:
-                    paper_authors.append(
-                        {
-                            "name": author["name"],
-                            "family_name": author["family_name"],
-                            "orcid": author["orcid"],
-                            "author_id": author["author_id"],
-                        }
-                    )
-                related_items.append(
-                    {
-                        "name": related_item["name"],
-                        "abstract": related_item["abstract"],
-                        "authors": paper_authors,
-                    }
-                )
+        """Map a paper entity to its DTO.
+
+        The DTOs here are built from repository data that is already in the
+        right shape, so model_construct is used to skip pydantic validation
+        in this per-row loop.
+        """
+        memo_key = (paper.id, paper.updated_at)
+        if paper.id and paper.updated_at:
+            with _paper_dto_cache_lock:
+                cached = _paper_dto_cache.get(memo_key)
+                if cached is not None:
+                    _paper_dto_cache.move_to_end(memo_key)
+                    return cached
+
+        # The repository layer always yields Author entities here, so the
+        # loop no longer type-dispatches on dict rows.
+        authors = [
+            ShortAuthorOutputDTO.model_construct(
+                name=author.name,
+                family_name=author.family_name,
+                orcid=author.orcid,
+                author_id=author.author_id,
+                affiliation=author.affiliation,
+            )
+            for author in paper.authors
+        ]
+        research_fields = [
+            {
+                "label": research_field.label,
+                "research_field_id": research_field.research_field_id,
+                "related_identifier": research_field.related_identifier,
+            }
+            for research_field in (paper.research_fields or [])
+        ]
 
         scientific_venue = None
         # if paper.journal:
@@ -1328,7 +1384,7 @@ class PaperServiceImpl(PaperServiceInterface):
         #         "id": journal.journal_conference_id,
         #         "identifier": journal._id,
         #     }
-        return ShortPaperOutputDTO(
+        dto = ShortPaperOutputDTO.model_construct(
             id=paper.id,
             article_id=paper.article_id,
             name=paper.name,
@@ -1343,25 +1399,21 @@ class PaperServiceImpl(PaperServiceInterface):
             journal=scientific_venue,
             date_published=paper.date_published,
         )
+        if paper.id and paper.updated_at:
+            with _paper_dto_cache_lock:
+                _paper_dto_cache[memo_key] = dto
+                if len(_paper_dto_cache) > _PAPER_DTO_CACHE_MAX:
+                    _paper_dto_cache.popitem(last=False)
+        return dto
 
     def _map_statement_to_dto(self, statement) -> StatementOutputDTO:
         """Map a statement entity to its DTO."""
-        authors = []
-        for author in statement.author:
-            if isinstance(author, dict):
-                authors.append(
-                    ShortAuthorOutputDTO(
-                        name=author.name,
-                    )
-                )
-            else:
-                authors.append(
-                    ShortAuthorOutputDTO(
-                        name=author.name,
-                    )
-                )
+        authors = [
+            ShortAuthorOutputDTO.model_construct(name=author.name)
+            for author in statement.author
+        ]
 
-        return ShortStatementOutputDTO(
+        return ShortStatementOutputDTO.model_construct(
             id=statement.id,
             statement_id=statement.statement_id,
             authors=authors,
@@ -16,6 +16,9 @@ class Author:
     name: Optional[str] = None
     affiliation: Optional[Any] = None
 
+    def __post_init__(self):
+        self.label = self.label or f"{self.given_name} {self.family_name}"
+
     @property
     def full_name(self) -> str:
         return f"{self.given_name} {self.family_name}"
@@ -0,0 +1,42 @@
+from django.db import migrations
+
+CREATE_VIEW_SQL = """
+CREATE MATERIALIZED VIEW mv_articles_statements_per_month AS
+WITH articles_per_month AS (
+    SELECT date_trunc('month', a.date_published) AS month,
+           COUNT(*) AS article_count
+    FROM digital_objects a
+    WHERE a.date_published IS NOT NULL
+    GROUP BY 1
+), statements_per_month AS (
+    SELECT date_trunc('month', a.date_published) AS month,
+           COUNT(*) AS statement_count
+    FROM statements s
+    JOIN digital_objects a ON a.id = s.article_id
+    WHERE a.date_published IS NOT NULL
+    GROUP BY 1
+)
+SELECT COALESCE(apm.month, spm.month) AS month,
+       COALESCE(apm.article_count, 0) AS article_count,
+       COALESCE(spm.statement_count, 0) AS statement_count
+FROM articles_per_month apm
+FULL OUTER JOIN statements_per_month spm ON apm.month = spm.month;
+
+CREATE UNIQUE INDEX mv_articles_statements_per_month_month_idx
+    ON mv_articles_statements_per_month (month);
+"""
+
+DROP_VIEW_SQL = """
+DROP MATERIALIZED VIEW IF EXISTS mv_articles_statements_per_month;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("infrastructure", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_VIEW_SQL, DROP_VIEW_SQL),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Coalesce, Concat, NullIf
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("infrastructure", "0002_per_month_materialized_view"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="author",
+            name="label",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=Coalesce(
+                    NullIf("name", Value("")),
+                    Concat("given_name", Value(" "), "family_name"),
+                ),
+                output_field=models.TextField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="author",
+            index=models.Index(fields=["label"], name="authors_label_idx"),
+        ),
+    ]
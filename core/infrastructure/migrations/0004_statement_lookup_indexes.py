@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("infrastructure", "0003_author_label_generated"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="statement",
+            index=models.Index(
+                fields=["statement_id"], name="statements_statement_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="statement",
+            index=models.Index(
+                fields=["article", "order"], name="statements_article_order_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("infrastructure", "0004_statement_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="statement",
+            index=models.Index(fields=["label", "id"], name="statements_label_id_idx"),
+        ),
+    ]
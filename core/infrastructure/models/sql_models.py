@@ -1,7 +1,10 @@
+import logging
 import os
+from functools import cached_property
 from django.conf import settings
 from django.db import models
-from django.db.models import JSONField
+from django.db.models import JSONField, Value
+from django.db.models.functions import Coalesce, Concat, NullIf
 from django.db.models.signals import post_save, post_migrate
 from django.utils.translation import gettext_lazy as _
 from django.contrib.postgres.fields import ArrayField
@@ -17,6 +20,8 @@ from core.infrastructure.repositories.sql_repos_helper import (
 )
 from django.core.files.storage import FileSystemStorage
 
+logger = logging.getLogger(__name__)
+
 
 class OverwriteStorage(FileSystemStorage):
     def get_available_name(self, name, max_length=None):
@@ -119,12 +124,23 @@ class Author(TimeStampedModel):
     name = models.TextField(null=True, blank=True)
     orcid = models.CharField(max_length=50, null=True, blank=True)
     json = JSONField(null=True, blank=True)
+    # Display label computed once by the database instead of per row in
+    # Python; a stored column also lets a-z/z-a listings sort on an index.
+    label = models.GeneratedField(
+        expression=Coalesce(
+            NullIf("name", Value("")),
+            Concat("given_name", Value(" "), "family_name"),
+        ),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
 
     class Meta:
         db_table = "authors"
         indexes = [
             models.Index(fields=["author_id"]),
             models.Index(fields=["name"]),
+            models.Index(fields=["label"], name="authors_label_idx"),
         ]
 
     def __str__(self):
@@ -848,9 +864,6 @@ class Article(TimeStampedModel):
                 try:
                     self.ro_crate.delete(save=False)
                 except Exception as e:
-                    import logging
-
-                    logger = logging.getLogger(__name__)
                     logger.warning(
                         f"Error deleting ro_crate file for Article {self.id}: {e}"
                     )
@@ -936,6 +949,15 @@ class SchemaType(TimeStampedModel):
     )
     last_updated = models.DateTimeField(auto_now=True)
 
+    @cached_property
+    def short_properties(self):
+        """Property URIs with everything up to the \"#\" stripped.
+
+        Computed once per instance; the serializers read this list for
+        every statement they emit.
+        """
+        return [s.partition("#")[2] for s in (self.property or [])]
+
     class Meta:
         db_table = "schemata"
         indexes = [
@@ -991,7 +1013,17 @@ class Statement(TimeStampedModel):
 
     class Meta:
         db_table = "statements"
-        indexes = [models.Index(fields=["_id"]), GinIndex(fields=["search_vector"])]
+        indexes = [
+            models.Index(fields=["_id"]),
+            GinIndex(fields=["search_vector"]),
+            # Single-statement lookups filter on statement_id; the ordered
+            # per-article prefetch reads (article, order) directly.
+            models.Index(fields=["statement_id"], name="statements_statement_id_idx"),
+            models.Index(fields=["article", "order"], name="statements_article_order_idx"),
+            # Backs the (label, id) row-value filter used by keyset
+            # pagination of the a-z listing.
+            models.Index(fields=["label", "id"], name="statements_label_id_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
@@ -1110,9 +1142,13 @@ def figure_source_image_upload_path_alternative(instance, filename):
         if os.path.exists(full_target_path):
             try:
                 os.remove(full_target_path)
-                print(f"Deleted existing file at target location: {full_target_path}")
+                logger.debug(
+                    "Deleted existing file at target location: %s", full_target_path
+                )
             except Exception as e:
-                print(f"Error deleting existing file at target location: {e}")
+                logger.warning(
+                    "Error deleting existing file at target location: %s", e
+                )
 
         return upload_path
     except Exception:
@@ -1151,9 +1187,11 @@ def dataitem_source_file_upload_path(instance, filename):
     if os.path.exists(full_target_path):
         try:
             os.remove(full_target_path)
-            print(f"Deleted existing file at target location: {full_target_path}")
+            logger.debug(
+                "Deleted existing file at target location: %s", full_target_path
+            )
         except Exception as e:
-            print(f"Error deleting existing file at target location: {e}")
+            logger.warning("Error deleting existing file at target location: %s", e)
 
     return upload_path
 
@@ -19,9 +19,11 @@ class SearchRepositoryImpl(SearchRepository):
         try:
             if self.use_weaviate:
                 logger.info("Using Weaviate for semantic search")
+                # One engine serves both roles; a second instance would
+                # open another client connection for no benefit.
                 self.semantic_engine = WeaviateSearchEngine()
                 self.keyword_engine = KeywordSearchEngine()
-                self.hybrid_engine = WeaviateSearchEngine()
+                self.hybrid_engine = self.semantic_engine
             else:
                 logger.info("Using default semantic search engines")
                 self.semantic_engine = SemanticSearchEngine()
@@ -33,7 +35,7 @@ class SearchRepositoryImpl(SearchRepository):
             logger.error(f"Error initializing search engines: {str(e)}")
             if self.use_weaviate:
                 self.semantic_engine = WeaviateSearchEngine()
-                self.hybrid_engine = WeaviateSearchEngine()
+                self.hybrid_engine = self.semantic_engine
             else:
                 self.semantic_engine = SemanticSearchEngine()
                 self.keyword_engine = None
@@ -16,20 +16,24 @@ class SQLAuthorRepository(AuthorRepository):
         self, search_query: str, page: int, page_size: int
     ) -> List[Author]:
         try:
-            authors_queryset = AuthorModel.objects.filter(
-                name__icontains=search_query
-            ).order_by("name")[:5]
-            authors = []
-            for author_model in authors_queryset:
-                author = Author(
-                    author_id=author_model.author_id,
-                    orcid=author_model.orcid,
-                    given_name=author_model.given_name,
-                    family_name=author_model.family_name,
-                    name=author_model.name,
+            author_rows = (
+                AuthorModel.objects.filter(name__icontains=search_query)
+                .order_by("label")
+                .values(
+                    "author_id", "orcid", "given_name", "family_name", "name", "label"
+                )[:5]
+            )
+            return [
+                Author(
+                    author_id=row["author_id"],
+                    orcid=row["orcid"],
+                    given_name=row["given_name"],
+                    family_name=row["family_name"],
+                    name=row["name"],
+                    label=row["label"],
                 )
-                authors.append(author)
-            return authors
+                for row in author_rows
+            ]
 
         except Exception as e:
             logger.error(f"Error in find_by_name: {str(e)}")
@@ -58,13 +62,13 @@ class SQLAuthorRepository(AuthorRepository):
                 author.id = generate_static_id(author.given_name + author.family_name)
 
             # Create or update author
+            # `label` is a stored generated column; the database derives it
+            # from name/given_name/family_name on write.
             author_model, created = AuthorModel.objects.update_or_create(
                 id=author.id,
                 defaults={
                     "given_name": author.given_name,
                     "family_name": author.family_name,
-                    "label": author.label
-                    or f"{author.given_name} {author.family_name}",
                 },
             )
 
@@ -97,28 +101,40 @@ class SQLAuthorRepository(AuthorRepository):
                 )
 
             if sort_order == "a-z":
-                query = query.order_by("name")
+                query = query.order_by("label")
             elif sort_order == "z-a":
-                query = query.order_by("-name")
+                query = query.order_by("-label")
             elif sort_order == "newest":
                 query = query.order_by("-id")
             else:
-                query = query.order_by("name")
+                query = query.order_by("label")
 
             total = query.count()
 
-            paginator = Paginator(query, page_size)
+            paginator = Paginator(
+                query.values(
+                    "id",
+                    "orcid",
+                    "author_id",
+                    "given_name",
+                    "family_name",
+                    "name",
+                    "label",
+                ),
+                page_size,
+            )
             page_obj = paginator.get_page(page)
 
             authors = []
-            for author_model in page_obj:
+            for row in page_obj:
                 author = Author(
-                    id=author_model.id,
-                    orcid=author_model.orcid,
-                    author_id=author_model.author_id,
-                    given_name=author_model.given_name,
-                    family_name=author_model.family_name,
-                    name=author_model.name,
+                    id=row["id"],
+                    orcid=row["orcid"],
+                    author_id=row["author_id"],
+                    given_name=row["given_name"],
+                    family_name=row["family_name"],
+                    name=row["name"],
+                    label=row["label"],
                 )
                 authors.append(author)
             return authors, total
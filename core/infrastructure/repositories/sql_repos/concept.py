@@ -16,18 +16,19 @@ class SQLConceptRepository(ConceptRepository):
         self, search_query: str, page: int, page_size: int
     ) -> List[Concept]:
         try:
-            concepts_queryset = ConceptModel.objects.filter(
-                label__icontains=search_query
-            ).order_by("label")[:3]
-            concepts = []
-            for concept_model in concepts_queryset:
-                concept = Concept(
-                    id=concept_model.id,
-                    label=concept_model.label,
-                    concept_id=concept_model.concept_id,
+            concept_rows = (
+                ConceptModel.objects.filter(label__icontains=search_query)
+                .order_by("label")
+                .values("id", "label", "concept_id")[:3]
+            )
+            return [
+                Concept(
+                    id=row["id"],
+                    label=row["label"],
+                    concept_id=row["concept_id"],
                 )
-                concepts.append(concept)
-            return concepts
+                for row in concept_rows
+            ]
 
         except Exception as e:
             logger.error(f"Error in find_by_name: {str(e)}")
@@ -43,20 +44,20 @@ class SQLConceptRepository(ConceptRepository):
 
     def find_by_label(self, label: str) -> List[Concept]:
         try:
-            concepts_queryset = ConceptModel.objects.filter(
-                label__icontains=label
-            ).order_by("label")[:3]  # Limit to 10 concepts
+            concept_rows = (
+                ConceptModel.objects.filter(label__icontains=label)
+                .order_by("label")
+                .values("id", "label", "identifier")[:3]
+            )
 
-            concepts = []
-            for concept_model in concepts_queryset:
-                concept = Concept(
-                    id=concept_model.id,
-                    label=concept_model.label,
-                    identifier=concept_model.identifier,
+            return [
+                Concept(
+                    id=row["id"],
+                    label=row["label"],
+                    identifier=row["identifier"],
                 )
-                concepts.append(concept)
-
-            return concepts
+                for row in concept_rows
+            ]
 
         except Exception as e:
             logger.error(f"Error in find_by_label: {str(e)}")
@@ -81,18 +82,19 @@ class SQLConceptRepository(ConceptRepository):
 
     def get_latest_concepts(self, limit: int = 8) -> List[Concept]:
         try:
-            concepts_queryset = ConceptModel.objects.all().order_by("-id")[:limit]
+            concept_rows = (
+                ConceptModel.objects.order_by("-id")
+                .values("id", "label", "identifier")[:limit]
+            )
 
-            concepts = []
-            for concept_model in concepts_queryset:
-                concept = Concept(
-                    id=concept_model.id,
-                    label=concept_model.label,
-                    identifier=concept_model.identifier,
+            return [
+                Concept(
+                    id=row["id"],
+                    label=row["label"],
+                    identifier=row["identifier"],
                 )
-                concepts.append(concept)
-
-            return concepts
+                for row in concept_rows
+            ]
 
         except Exception as e:
             logger.error(f"Error in get_latest_concepts: {str(e)}")
@@ -128,15 +130,17 @@ class SQLConceptRepository(ConceptRepository):
             total = query.count()
 
             # Apply pagination
-            paginator = Paginator(query, page_size)
+            paginator = Paginator(
+                query.values("id", "label", "identifier"), page_size
+            )
             page_obj = paginator.get_page(page)
 
             concepts = []
-            for concept_model in page_obj:
+            for row in page_obj:
                 concept = Concept(
-                    id=concept_model.id,
-                    label=concept_model.label,
-                    identifier=concept_model.identifier,
+                    id=row["id"],
+                    label=row["label"],
+                    identifier=row["identifier"],
                 )
                 concepts.append(concept)
 
@@ -1,9 +1,19 @@
-from django.db.models import Count
-from django.db.models.functions import TruncMonth
-from django.db.models import Count, Q
+from django.db import connection
+from django.db.models import Count, F, IntegerField, Q, Sum, Window
+from django.db.models.functions import Cast, Round
 from core.application.interfaces.repositories.insight import InsightRepository
 from core.domain.exceptions import DatabaseError
+from core.infrastructure.repositories.sql_repos.insight_serializers import (
+    serialize_component,
+)
 from core.infrastructure.models.sql_models import (
+    Author as AuthorModel,
+    Periodical as PeriodicalModel,
+    Matrix as MatrixModel,
+    ObjectOfInterest as ObjectOfInterestModel,
+    Operation as OperationModel,
+    Property as PropertyModel,
+    Unit as UnitModel,
     Software as SoftwareModel,
     SoftwareLibrary as SoftwareLibraryModel,
     Article as ArticleModel,
@@ -22,116 +32,245 @@ from core.infrastructure.models.sql_models import (
     FactorAnalysis as FactorAnalysisModel,
 )
 from collections import defaultdict
+from dataclasses import asdict
 import logging
-import re
 
 logger = logging.getLogger(__name__)
 
+_DATA_TYPE_MODELS = (
+    ("Data Preprocessing", DataPreprocessingModel),
+    ("Descriptive Statistics", DescriptiveStatisticsModel),
+    ("Algorithm Evaluation", AlgorithmEvaluationModel),
+    ("Multilevel Analysis", MultilevelAnalysisModel),
+    ("Correlation Analysis", CorrelationAnalysisModel),
+    ("Group Comparison", GroupComparisonModel),
+    ("Regression Analysis", RegressionAnalysisModel),
+    ("Class Prediction", ClassPredictionModel),
+    ("Class Discovery", ClassDiscoveryModel),
+    ("Factor Analysis", FactorAnalysisModel),
+)
 
-class SQLInsightRepository(InsightRepository):
-    def get_per_month_articles_statements(self, research_fields=None) -> any:
-        qs = ArticleModel.objects.filter(date_published__isnull=False)
-        if research_fields:
-            qs = qs.filter(research_fields__research_field_id__in=research_fields)
-        articles_per_month = (
-            qs.annotate(month=TruncMonth("date_published"))
-            .values("month")
-            .annotate(article_count=Count("id"))
-            .order_by("month")
-            .distinct()
-        )
-        qs = StatementModel.objects.filter(article__date_published__isnull=False)
-        if research_fields:
-            qs = qs.filter(
-                article__research_fields__research_field_id__in=research_fields
-            )
-        statements_per_month = (
-            qs.annotate(month=TruncMonth("article__date_published"))
-            .values("month")
-            .annotate(statement_count=Count("id"))
-            .order_by("month")
-            .distinct()
-        )
+# Monthly article/statement counts, maintained by the migration-created
+# materialized view and refreshed after article writes.
+PER_MONTH_VIEW = "mv_articles_statements_per_month"
 
-        result = defaultdict(lambda: {"article_count": 0, "statement_count": 0})
+_COMPONENT_RELATIONS = (
+    ("operations", OperationModel),
+    ("matrices", MatrixModel),
+    ("object_of_interests", ObjectOfInterestModel),
+    ("properties", PropertyModel),
+    ("units", UnitModel),
+)
 
-        for entry in articles_per_month:
-            result[entry["month"]]["article_count"] = entry["article_count"]
 
-        for entry in statements_per_month:
-            result[entry["month"]]["statement_count"] = entry["statement_count"]
+class SQLInsightRepository(InsightRepository):
+    def get_count_statistics(self, research_fields=None) -> any:
+        try:
+            if research_fields:
+                return {
+                    "Articles": ArticleModel.objects.filter(
+                        research_fields__in=research_fields
+                    )
+                    .distinct()
+                    .count(),
+                    "Scientific statements": StatementModel.objects.filter(
+                        article__research_fields__in=research_fields
+                    )
+                    .distinct()
+                    .count(),
+                    "Journals": PeriodicalModel.objects.filter(
+                        research_fields__in=research_fields
+                    )
+                    .distinct()
+                    .count(),
+                    "Authors": AuthorModel.objects.filter(
+                        articles__research_fields__in=research_fields
+                    )
+                    .distinct()
+                    .count(),
+                }
 
-        articles_statements_per_month = [
-            {
-                "month": month.strftime("%Y - %m"),
-                "article_count": counts["article_count"],
-                "statement_count": counts["statement_count"],
+            sql = (
+                "SELECT"
+                f" (SELECT COUNT(*) FROM {ArticleModel._meta.db_table}),"
+                f" (SELECT COUNT(*) FROM {StatementModel._meta.db_table}),"
+                f" (SELECT COUNT(*) FROM {PeriodicalModel._meta.db_table}),"
+                f" (SELECT COUNT(*) FROM {AuthorModel._meta.db_table})"
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(sql)
+                articles, statements, journals, authors = cursor.fetchone()
+            return {
+                "Articles": articles,
+                "Scientific statements": statements,
+                "Journals": journals,
+                "Authors": authors,
             }
-            for month, counts in sorted(result.items())
-        ]
-        return articles_statements_per_month
 
-    def get_software_library_with_usage(self, research_fields=None) -> any:
-        qs = SoftwareLibraryModel.objects.exclude(label__isnull=True).exclude(
-            label__exact=""
-        )
+        except Exception as e:
+            logger.error(f"Error in count statistics: {str(e)}")
+            raise DatabaseError(f"Failed to count statistics: {str(e)}")
 
+    def get_per_month_articles_statements(self, research_fields=None) -> any:
+        if not research_fields:
+            # The unfiltered aggregate only changes when articles are
+            # written, so it is served from the materialized view instead of
+            # re-scanning both tables per dashboard load.
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT month, article_count, statement_count"
+                    f" FROM {PER_MONTH_VIEW} ORDER BY month"
+                )
+                return [
+                    {
+                        "month": month.strftime("%Y - %m"),
+                        "article_count": article_count,
+                        "statement_count": statement_count,
+                    }
+                    for month, article_count, statement_count in cursor.fetchall()
+                ]
+
+        article_table = ArticleModel._meta.db_table
+        statement_table = StatementModel._meta.db_table
+        field_filter = ""
+        params = []
         if research_fields:
-            qs = qs.filter(
-                software_methods__software_method__statement__article__research_fields__research_field_id__in=research_fields
+            field_filter = (
+                " AND EXISTS ("
+                "SELECT 1 FROM digital_objects_research_fields dorf"
+                " JOIN research_fields rf ON rf.id = dorf.researchfield_id"
+                " WHERE dorf.article_id = a.id"
+                " AND rf.research_field_id IN %s)"
             )
+            params = [tuple(research_fields), tuple(research_fields)]
 
-        qs = (
-            qs.values("part_of__label", "label")
-            .annotate(count=Count("id"))
-            .order_by("-count")
-            .distinct()
+        sql = (
+            "WITH articles_per_month AS ("
+            " SELECT date_trunc('month', a.date_published) AS month,"
+            " COUNT(*) AS article_count"
+            f" FROM {article_table} a"
+            " WHERE a.date_published IS NOT NULL"
+            f"{field_filter}"
+            " GROUP BY 1"
+            "), statements_per_month AS ("
+            " SELECT date_trunc('month', a.date_published) AS month,"
+            " COUNT(*) AS statement_count"
+            f" FROM {statement_table} s"
+            f" JOIN {article_table} a ON a.id = s.article_id"
+            " WHERE a.date_published IS NOT NULL"
+            f"{field_filter}"
+            " GROUP BY 1"
+            ")"
+            " SELECT COALESCE(apm.month, spm.month) AS month,"
+            " COALESCE(apm.article_count, 0),"
+            " COALESCE(spm.statement_count, 0)"
+            " FROM articles_per_month apm"
+            " FULL OUTER JOIN statements_per_month spm ON apm.month = spm.month"
+            " ORDER BY 1"
         )
 
-        packages = defaultdict(list)
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            articles_statements_per_month = [
+                {
+                    "month": month.strftime("%Y - %m"),
+                    "article_count": article_count,
+                    "statement_count": statement_count,
+                }
+                for month, article_count, statement_count in cursor.fetchall()
+            ]
+        return articles_statements_per_month
+
+    def get_software_library_with_usage(self, research_fields=None) -> any:
+        if research_fields:
+            qs = (
+                SoftwareLibraryModel.objects.exclude(label__isnull=True)
+                .exclude(label__exact="")
+                .filter(
+                    software_methods__software_method__statement__article__research_fields__research_field_id__in=research_fields
+                )
+                .values("part_of__label", "label")
+                .annotate(count=Count("id"))
+                .order_by("-count")
+                .distinct()
+            )
 
-        for item in qs:
-            label = item["part_of__label"]
-            packages[label].append({"label": item["label"], "count": item["count"]})
+            packages = defaultdict(list)
+            for item in qs:
+                label = item["part_of__label"]
+                packages[label].append(
+                    {"label": item["label"], "count": item["count"]}
+                )
+            return packages
 
-        return packages
+        library_table = SoftwareLibraryModel._meta.db_table
+        software_table = SoftwareModel._meta.db_table
+        sql = (
+            "SELECT s.label,"
+            " json_agg(json_build_object('label', sl.label, 'count', sl.count)"
+            " ORDER BY sl.count DESC)"
+            " FROM ("
+            " SELECT part_of_id, label, COUNT(*) AS count"
+            f" FROM {library_table}"
+            " WHERE label IS NOT NULL AND label <> ''"
+            " GROUP BY part_of_id, label"
+            ") sl"
+            f" LEFT JOIN {software_table} s ON s.id = sl.part_of_id"
+            " GROUP BY s.label"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            return dict(cursor.fetchall())
 
     def get_concepts_with_usage(self, research_fields=None):
-        concepts_qs = (
-            ConceptModel.objects.annotate(
-                usage_count=Count(
-                    "statements",
-                    filter=Q(
-                        statements__article__research_fields__research_field_id__in=research_fields
-                    )
-                    if research_fields
-                    else Q(),
-                    distinct=True,
-                )
+        concept_table = ConceptModel._meta.db_table
+        statement_concepts_table = StatementModel.concepts.through._meta.db_table
+        params = []
+        if research_fields:
+            # The research-field filter joins through articles and can repeat
+            # statements; without it the m2m rows are already unique, so skip
+            # the more expensive COUNT(DISTINCT).
+            count_expr = "COUNT(DISTINCT sc.statement_id)"
+            field_join = (
+                f" JOIN {StatementModel._meta.db_table} s ON s.id = sc.statement_id"
+                " JOIN digital_objects_research_fields dorf"
+                " ON dorf.article_id = s.article_id"
+                " JOIN research_fields rf ON rf.id = dorf.researchfield_id"
+                " AND rf.research_field_id IN %s"
             )
-            .filter(usage_count__gt=0)
-            .order_by("-usage_count", "label")
-            .values("label", "definition", "usage_count")[:10]
+            params = [tuple(research_fields)]
+        else:
+            count_expr = "COUNT(sc.statement_id)"
+            field_join = ""
+
+        sql = (
+            f"SELECT c.label, c.definition, {count_expr} AS usage_count"
+            f" FROM {concept_table} c"
+            f" JOIN {statement_concepts_table} sc ON sc.concept_id = c.id"
+            f"{field_join}"
+            " GROUP BY c.id, c.label, c.definition"
+            " ORDER BY usage_count DESC, c.label"
+            " LIMIT 10"
         )
 
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            concept_rows = cursor.fetchall()
+
         concepts_results = []
-        for concept in concepts_qs:
-            label = concept["label"]
-            match = re.search(r"\(([^)]+)\)", label)
-            acronym = (
-                match.group(1).strip()
-                if match
-                else (
-                    " ".join(label.split()[:3]) + "..."
-                    if len(label.split()) > 3
-                    else label
-                )
-            )
+        for label, definition, usage_count in concept_rows:
+            open_idx = label.find("(")
+            close_idx = label.find(")", open_idx + 1) if open_idx != -1 else -1
+            if close_idx != -1:
+                acronym = label[open_idx + 1 : close_idx].strip()
+            else:
+                words = label.split()
+                acronym = " ".join(words[:3]) + "..." if len(words) > 3 else label
             concepts_results.append(
                 {
                     "label": label,
-                    "definition": concept["definition"],
-                    "value": concept["usage_count"],
+                    "definition": definition,
+                    "value": usage_count,
                     "text": acronym,
                 }
             )
@@ -147,151 +286,93 @@ class SQLInsightRepository(InsightRepository):
             else Q()
         )
 
-        components_with_usage = (
+        component_rows = list(
             ComponentModel.objects.annotate(
-                usage_count=Count("statements", filter=usage_filter, distinct=True),
+                usage_count=Count(
+                    "statements",
+                    filter=usage_filter,
+                    distinct=bool(research_fields),
+                ),
             )
             .filter(usage_count__gt=0)
             .order_by("-usage_count", "pk")
-            .prefetch_related(
-                "operations",
-                "matrices",
-                "object_of_interests",
-                "properties",
-                "units",
-            )[:10] 
+            .values(
+                "id",
+                "label",
+                "type",
+                "string_match",
+                "exact_match",
+                "close_match",
+                "usage_count",
+            )[:10]
         )
-        components_results = []
-        for component in components_with_usage:
-            label = re.sub(r"[\[\]']", "", component.label)
-            if "Measure" in component.type or "Property" in component.type:
-                components_results.append(
-                    {
-                        "text": component.string_match[0],
-                        "label": component.string_match[0],
-                        "definition": label,
-                        "value": component.usage_count,
-                        "see_also": component.exact_match[0]
-                        if len(component.exact_match) > 0
-                        else component.close_match[0]
-                        if len(component.close_match) > 0
-                        else "",
-                        "operations": [],
-                        "matrices": [],
-                        "object_of_interests": [],
-                        "properties": [],
-                        "units": [],
-                    }
+        component_ids = [row["id"] for row in component_rows]
+
+        # One UNION ALL round-trip for all five relation tables instead of a
+        # query per relation; the join/column names come from the m2m field
+        # metadata so the SQL tracks the models.
+        related = {relation: defaultdict(list) for relation, _ in _COMPONENT_RELATIONS}
+        if component_ids:
+            union_parts = []
+            params = []
+            for relation, model in _COMPONENT_RELATIONS:
+                m2m = ComponentModel._meta.get_field(relation)
+                union_parts.append(
+                    f"SELECT '{relation}', j.{m2m.m2m_column_name()},"
+                    " r.label, r.exact_match, r.close_match"
+                    f" FROM {m2m.m2m_db_table()} j"
+                    f" JOIN {model._meta.db_table} r"
+                    f" ON r.id = j.{m2m.m2m_reverse_name()}"
+                    f" WHERE j.{m2m.m2m_column_name()} IN %s"
                 )
-            else:
-                operations = []
-                for operation in component.operations.all():
-                    operations.append(
+                params.append(tuple(component_ids))
+            with connection.cursor() as cursor:
+                cursor.execute(" UNION ALL ".join(union_parts), params)
+                for relation, component_id, label, exact, close in cursor.fetchall():
+                    related[relation][component_id].append(
                         {
-                            "label": operation.label[0],
-                            "see_also": operation.exact_match[0]
-                            if len(operation.exact_match) > 0
-                            else operation.close_match[0]
-                            if len(operation.close_match) > 0
-                            else "",
+                            "label": label,
+                            "exact_match": exact,
+                            "close_match": close,
                         }
                     )
-                matrices = []
-                for matrix in component.matrices.all():
-                    matrices.append(
-                        {
-                            "label": matrix.label[0],
-                            "see_also": matrix.exact_match[0]
-                            if len(matrix.exact_match) > 0
-                            else matrix.close_match[0]
-                            if len(matrix.close_match) > 0
-                            else "",
-                        }
-                    )
-                object_of_interests = []
-                for object_of_interest in component.object_of_interests.all():
-                    object_of_interests.append(
-                        {
-                            "label": object_of_interest.label[0],
-                            "see_also": object_of_interest.exact_match[0]
-                            if len(object_of_interest.exact_match) > 0
-                            else object_of_interest.close_match[0]
-                            if len(object_of_interest.close_match) > 0
-                            else "",
-                        }
-                    )
-                properties = []
-                for property in component.properties.all():
-                    properties.append(
-                        {
-                            "label": property.label[0],
-                            "see_also": property.exact_match[0]
-                            if len(property.exact_match) > 0
-                            else property.close_match[0]
-                            if len(property.close_match) > 0
-                            else "",
-                        }
-                    )
-                units = []
-                for unit in component.units.all():
-                    units.append(
-                        {
-                            "label": unit.label[0],
-                            "see_also": unit.exact_match[0]
-                            if len(unit.exact_match) > 0
-                            else unit.close_match[0]
-                            if len(unit.close_match) > 0
-                            else "",
-                        }
-                    )
-                components_results.append(
-                    {
-                        "text": component.string_match[0],
-                        "label": component.string_match[0],
-                        "definition": label,
-                        "value": component.usage_count,
-                        "see_also": component.exact_match
-                        if len(component.exact_match) > 0
-                        else component.close_match,
-                        "operations": operations,
-                        "matrices": matrices,
-                        "object_of_interests": object_of_interests,
-                        "properties": properties,
-                        "units": units,
-                    }
-                )
-        return components_results
 
-    def get_data_type_with_usage(self, research_fields=None):
-        models = [
-            ("Data Preprocessing", DataPreprocessingModel),
-            ("Descriptive Statistics", DescriptiveStatisticsModel),
-            ("Algorithm Evaluation", AlgorithmEvaluationModel),
-            ("Multilevel Analysis", MultilevelAnalysisModel),
-            ("Correlation Analysis", CorrelationAnalysisModel),
-            ("Group Comparison", GroupComparisonModel),
-            ("Regression Analysis", RegressionAnalysisModel),
-            ("Class Prediction", ClassPredictionModel),
-            ("Class Discovery", ClassDiscoveryModel),
-            ("Factor Analysis", FactorAnalysisModel),
+        return [
+            asdict(serialize_component(row, related)) for row in component_rows
         ]
 
+    def get_data_type_with_usage(self, research_fields=None):
         data_types = []
 
-        for name, model in models:
-            qs = model.objects.all()
-
-            if research_fields:
-                qs = qs.filter(
-                    statement__article__research_fields__research_field_id__in=research_fields
+        if research_fields:
+            for name, model in _DATA_TYPE_MODELS:
+                count = (
+                    model.objects.filter(
+                        statement__article__research_fields__research_field_id__in=research_fields
+                    )
+                    .distinct()
+                    .count()
                 )
 
-            count = qs.distinct().count()
+                if count > 0:
+                    data_types.append({"label": name, "count": count})
 
-            if count > 0:
-                data_types.append({"label": name, "count": count})
+            return sorted(data_types, key=lambda x: x["count"], reverse=True)
 
-        return sorted(data_types, key=lambda x: x["count"], reverse=True)
+        sql = (
+            "SELECT label, count FROM ("
+            + " UNION ALL ".join(
+                f"SELECT '{name}' AS label, COUNT(*) AS count "
+                f"FROM {model._meta.db_table}"
+                for name, model in _DATA_TYPE_MODELS
+            )
+            + ") counts WHERE count > 0 ORDER BY count DESC"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+            return [
+                {"label": label, "count": count} for label, count in cursor.fetchall()
+            ]
 
     def get_programming_language_with_usage(self, research_fields=None):
         qs = SoftwareModel.objects.all()
@@ -302,13 +383,21 @@ class SQLInsightRepository(InsightRepository):
             )
 
         programming_languages = (
-            qs.distinct().values("label").annotate(count=Count("id"))
+            qs.distinct()
+            .values("label")
+            .annotate(usage=Count("id"))
+            .annotate(
+                count=Cast(
+                    Round(100.0 * F("usage") / Window(Sum("usage"))),
+                    IntegerField(),
+                )
+            )
+            .values("label", "count")
         )
-
-        total_count = sum(item["count"] for item in programming_languages) or 1
-        for item in programming_languages:
-            item["count"] = round((item["count"] / total_count) * 100)
-        return programming_languages
+        # Materialize before returning: the payload is rendered by orjson,
+        # which (unlike DRF's stock JSONRenderer) does not iterate lazy
+        # querysets.
+        return list(programming_languages)
 
     def get_research_insights(self) -> any:
         try:
@@ -320,8 +409,8 @@ class SQLInsightRepository(InsightRepository):
             ).annotate(library_count=Count("id"))
             return [
                 {
-                    "models_by_label": models_by_label,
-                    "libraries_by_label": libraries_by_label,
+                    "models_by_label": list(models_by_label),
+                    "libraries_by_label": list(libraries_by_label),
                 }
             ]
 
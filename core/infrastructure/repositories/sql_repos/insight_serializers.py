@@ -0,0 +1,80 @@
+"""Hot-path serialization helpers for the insight repository.
+
+Kept in their own module with full type annotations so the whole file can
+be ahead-of-time compiled (mypyc/Cython) without touching the repository
+logic; the loop bodies are pure string/dict work with no ORM access.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping
+
+_STRIP_TABLE = str.maketrans("", "", "[]'")
+
+
+@dataclass(slots=True)
+class ComponentRecord:
+    text: str
+    label: str
+    definition: str
+    value: int
+    see_also: Any
+    operations: list
+    matrices: list
+    object_of_interests: list
+    properties: list
+    units: list
+
+
+def first_or(exact: List[str], close: List[str]) -> str:
+    if exact:
+        return exact[0]
+    if close:
+        return close[0]
+    return ""
+
+
+def serialize_related(rows: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    return [
+        {
+            "label": row["label"][0],
+            "see_also": first_or(row["exact_match"], row["close_match"]),
+        }
+        for row in rows
+    ]
+
+
+def serialize_component(
+    component: Dict[str, Any], related: Mapping[str, Mapping[int, list]]
+) -> ComponentRecord:
+    label = component["label"].translate(_STRIP_TABLE)
+    if "Measure" in component["type"] or "Property" in component["type"]:
+        return ComponentRecord(
+            text=component["string_match"][0],
+            label=component["string_match"][0],
+            definition=label,
+            value=component["usage_count"],
+            see_also=first_or(component["exact_match"], component["close_match"]),
+            operations=[],
+            matrices=[],
+            object_of_interests=[],
+            properties=[],
+            units=[],
+        )
+
+    component_id = component["id"]
+    return ComponentRecord(
+        text=component["string_match"][0],
+        label=component["string_match"][0],
+        definition=label,
+        value=component["usage_count"],
+        see_also=component["exact_match"]
+        if len(component["exact_match"]) > 0
+        else component["close_match"],
+        operations=serialize_related(related["operations"][component_id]),
+        matrices=serialize_related(related["matrices"][component_id]),
+        object_of_interests=serialize_related(
+            related["object_of_interests"][component_id]
+        ),
+        properties=serialize_related(related["properties"][component_id]),
+        units=serialize_related(related["units"][component_id]),
+    )
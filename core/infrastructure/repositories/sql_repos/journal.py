@@ -17,19 +17,20 @@ class SQLJournalRepository(JournalRepository):
         self, search_query: str, page: int, page_size: int
     ) -> List[Journal]:
         try:
-            journals_queryset = PeriodicalModel.objects.filter(
-                name__icontains=search_query
-            ).order_by("name")[:5]
-            journals = []
-            for journal_model in journals_queryset:
-                journal = Journal(
-                    id=journal_model.id,
-                    label=journal_model.name,
-                    journal_conference_id=journal_model.periodical_id,
-                    publisher=journal_model.publisher.name,
+            journal_rows = (
+                PeriodicalModel.objects.filter(name__icontains=search_query)
+                .order_by("name")
+                .values("id", "name", "periodical_id", "publisher__name")[:5]
+            )
+            return [
+                Journal(
+                    id=row["id"],
+                    label=row["name"],
+                    journal_conference_id=row["periodical_id"],
+                    publisher=row["publisher__name"],
                 )
-                journals.append(journal)
-            return journals
+                for row in journal_rows
+            ]
 
         except Exception as e:
             logger.error(f"Error in get_academic_publishers_by_name: {str(e)}")
@@ -63,7 +63,18 @@ from core.infrastructure.models.sql_models import (
     Contribution as ContributionModel,
 )
 from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import Q, F, Case, When
+from django.db import connection
+from django.db.models import (
+    Q,
+    F,
+    Case,
+    When,
+    Prefetch,
+    Window,
+    Count,
+    Value,
+    CharField,
+)
 from core.domain.exceptions import DatabaseError
 from django.core.paginator import Paginator
 from datetime import datetime
@@ -73,6 +84,62 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _statements_prefetch() -> Prefetch:
+    """Ordered statements prefetch for the detail/list serializers.
+
+    The wide per-statement payload columns (raw json, content, the search
+    vector) are deferred because the serializers only read identifiers and
+    labels; skipping them keeps the prefetch rows small.
+    """
+    return Prefetch(
+        "statements",
+        queryset=StatementModel.objects.order_by("order")
+        .defer("json", "content", "search_vector")
+        .prefetch_related(
+            # orcid_url is the orcid column filtered to actual ORCID URLs in
+            # SQL, so the serializers read it without a per-author
+            # startswith check.
+            Prefetch(
+                "authors",
+                queryset=AuthorModel.objects.defer("json").annotate(
+                    orcid_url=Case(
+                        When(
+                            orcid__startswith="https://orcid.org/",
+                            then=F("orcid"),
+                        ),
+                        default=Value(None),
+                        output_field=CharField(),
+                    )
+                ),
+            ),
+            Prefetch("concepts", queryset=ConceptModel.objects.defer("json")),
+            Prefetch(
+                "has_part_statements",
+                queryset=HasPartModel.objects.order_by("id").select_related(
+                    "schema_type"
+                ),
+                to_attr="prefetched_has_parts",
+            ),
+        ),
+    )
+
+
+def _refresh_per_month_view() -> None:
+    """Refresh the per-month dashboard aggregate after article writes.
+
+    CONCURRENTLY keeps dashboard reads unblocked during the refresh. A
+    failed refresh only leaves the aggregate slightly stale, so it is
+    logged rather than allowed to fail the write that triggered it.
+    """
+    from core.infrastructure.repositories.sql_repos.insight import PER_MONTH_VIEW
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {PER_MONTH_VIEW}")
+    except Exception as e:
+        logger.warning(f"Could not refresh {PER_MONTH_VIEW}: {str(e)}")
+
+
 class SQLPaperRepository(PaperRepository):
     def __init__(self, type_registry_client: TypeRegistryClient):
         self.type_registry_client = type_registry_client
@@ -82,15 +149,41 @@ class SQLPaperRepository(PaperRepository):
         try:
             queryset = (
                 ArticleModel.objects.all()
-                .only("name", "date_published")
-                .prefetch_related("authors", "journal_conference")
+                .select_related("publisher")
+                .prefetch_related(
+                    "authors__affiliation",
+                    "journal_conference",
+                    "concepts",
+                    "research_fields",
+                    "statements",
+                )
             )
-            total = queryset.count()
-            paginator = Paginator(queryset, page_size)
-            page_obj = paginator.get_page(page)
+            # COUNT(*) OVER () rides along on the page query, so the total
+            # comes back with the rows instead of from a second COUNT.
+            if page < 1:
+                page = 1
+            offset = (page - 1) * page_size
+            rows = list(
+                queryset.order_by("pk").annotate(
+                    total=Window(expression=Count("pk"))
+                )[offset : offset + page_size]
+            )
+            if rows:
+                total = rows[0].total
+            else:
+                # Out-of-range page: clamp to the last page like
+                # Paginator.get_page used to. Costs an exact COUNT plus a
+                # re-fetch, but only on the rare over-shot request.
+                total = queryset.count()
+                if total:
+                    last_page = max((total + page_size - 1) // page_size, 1)
+                    offset = (last_page - 1) * page_size
+                    rows = list(
+                        queryset.order_by("pk")[offset : offset + page_size]
+                    )
 
             papers = []
-            for article in page_obj:
+            for article in rows:
                 paper = self._convert_article_to_paper(article)
                 papers.append(paper)
             return papers, total
@@ -98,6 +191,29 @@ class SQLPaperRepository(PaperRepository):
             logger.error(f"Error in find_all: {str(e)}")
             raise DatabaseError(f"Failed to retrieve papers: {str(e)}")
 
+    def estimated_count(self) -> int:
+        """Planner row estimate for the articles table.
+
+        COUNT(*) has to scan; pg_class.reltuples is kept current by
+        autovacuum/ANALYZE and is accurate enough for pagination totals on
+        pages past the first.
+        """
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [ArticleModel._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 on a never-analyzed table; fall back to the
+            # exact count in that case.
+            if row and row[0] >= 0:
+                return int(row[0])
+            return ArticleModel.objects.count()
+        except Exception as e:
+            logger.error(f"Error in estimated_count: {str(e)}")
+            raise DatabaseError(f"Failed to estimate article count: {str(e)}")
+
     def get_count_all(self, research_fields=None) -> any:
         try:
             if not research_fields:
@@ -115,7 +231,21 @@ class SQLPaperRepository(PaperRepository):
 
     def find_by_id(self, paper_id: str) -> Optional[Article]:
         try:
-            article = ArticleModel.objects.filter(article_id=paper_id).first()
+            # Prefetch everything the paper detail page walks (statements in
+            # display order, their authors/concepts and typed has-part rows)
+            # so the whole fetch is a fixed number of queries instead of one
+            # per statement.
+            article = (
+                ArticleModel.objects.filter(article_id=paper_id)
+                .select_related("publisher")
+                .prefetch_related(
+                    "authors__affiliation",
+                    "concepts",
+                    "research_fields",
+                    _statements_prefetch(),
+                )
+                .first()
+            )
             if article:
                 return self._convert_article_to_paper(article)
 
@@ -127,8 +257,16 @@ class SQLPaperRepository(PaperRepository):
 
     def search_by_title(self, title: str) -> List[Article]:
         try:
-            articles = ArticleModel.objects.filter(name__icontains=title).order_by(
-                "name"
+            articles = (
+                ArticleModel.objects.filter(name__icontains=title)
+                .select_related("publisher")
+                .prefetch_related(
+                    "authors__affiliation",
+                    "concepts",
+                    "research_fields",
+                    "statements",
+                )
+                .order_by("name")
             )
 
             papers = []
@@ -198,28 +336,48 @@ class SQLPaperRepository(PaperRepository):
                     research_fields__research_field_id__in=research_field_ids
                 )
 
-            query = query.distinct()
-
-            query = query.select_related("journal_conference").prefetch_related(
-                "authors", "concepts", "research_fields"
-            )
+            # Page over distinct article ids first. The filter joins fan out
+            # across authors/concepts/fields, and DISTINCT over the full
+            # joined rows both transfers duplicate data and breaks page_size;
+            # deduplicating narrow (id, ordering) tuples is cheap and exact
+            # because the ordering columns are per-article.
             if title:
                 query = query.order_by("-search_rank", "-date_published", "name")
+                id_rows = query.values_list(
+                    "pk", "search_rank", "date_published", "name"
+                ).distinct()
             else:
                 query = query.order_by("-date_published", "name")
-            total = query.count()
-            paginator = Paginator(query, page_size)
+                id_rows = query.values_list("pk", "date_published", "name").distinct()
+
+            total = id_rows.count()
+            paginator = Paginator(id_rows, page_size)
             if page < 1:
                 page = 1
             elif page > paginator.num_pages and paginator.num_pages > 0:
                 page = paginator.num_pages
 
             page_obj = paginator.get_page(page)
+            page_ids = [row[0] for row in page_obj]
+
+            # Statements are prefetched in display order with everything the
+            # query_data serializer walks, so the per-paper loops never go
+            # back to the database.
+            articles = ArticleModel.objects.filter(pk__in=page_ids).select_related(
+                "journal_conference", "publisher"
+            ).prefetch_related(
+                "authors__affiliation",
+                "concepts",
+                "research_fields",
+                _statements_prefetch(),
+            )
+            articles_by_id = {article.pk: article for article in articles}
 
             papers = []
-            for article in page_obj:
-                paper = self._convert_article_to_paper(article)
-                papers.append(paper)
+            for article_id in page_ids:
+                article = articles_by_id.get(article_id)
+                if article is not None:
+                    papers.append(self._convert_article_to_paper(article))
             return papers, total
 
         except Exception as e:
@@ -385,7 +543,27 @@ class SQLPaperRepository(PaperRepository):
                     elif sort_order == "DESC":
                         query = query.order_by("-date_published")
 
-            total = query.count()
+            # The entity converter never reads the raw json blob or the search
+            # vector; deferring them keeps the wide TOASTed columns out of
+            # the page SELECT.
+            query = (
+                query.select_related("publisher")
+                .prefetch_related(
+                    "authors__affiliation", "concepts", "research_fields", "statements"
+                )
+                .defer("json", "search_vector")
+            )
+            unfiltered = not (
+                search_query
+                or research_fields
+                or authors
+                or concepts
+                or scientific_venues
+            )
+            if unfiltered and page > 1:
+                total = self.estimated_count()
+            else:
+                total = query.count()
 
             paginator = Paginator(query, page_size)
             page_obj = paginator.get_page(page)
@@ -408,7 +586,16 @@ class SQLPaperRepository(PaperRepository):
         page_size: int = 10,
     ) -> Tuple[List[Article], int]:
         try:
-            query = ArticleModel.objects.filter(id__in=ids)
+            query = (
+                ArticleModel.objects.filter(id__in=ids)
+                .select_related("publisher")
+                .prefetch_related(
+                    "authors__affiliation",
+                    "concepts",
+                    "research_fields",
+                    "statements",
+                )
+            )
 
             if sort_order == "a-z":
                 query = query.order_by("name")
@@ -483,7 +670,7 @@ class SQLPaperRepository(PaperRepository):
                 return info[f"{_type}#{property}".replace("doi:", "doi:21.T11969/")]
 
         except Exception as e:
-            print(f"{str(e)}")
+            logger.debug("Error reading info property %s: %s", property, e)
 
     def read_data(self, paper_data):
         graph_data = paper_data.get("@graph", [])
@@ -2044,8 +2231,9 @@ class SQLPaperRepository(PaperRepository):
                                     AlgorithmEvaluation.has_inputs.set(has_input_items)
 
                 else:
-                    print("no", p)
+                    logger.debug("Unhandled data type %s", p)
 
+        _refresh_per_month_view()
         return True
 
     # except Exception as e:
@@ -2057,6 +2245,7 @@ class SQLPaperRepository(PaperRepository):
             article = ArticleModel.objects.get(article_id=article_id)
             article.delete()
             logger.info(f"Successfully deleted article: {article_id}")
+            _refresh_per_month_view()
             return True
 
         except ArticleModel.DoesNotExist:
@@ -2171,13 +2360,16 @@ class SQLPaperRepository(PaperRepository):
             concepts.append(Concept(id=concept.concept_id, label=concept.label))
 
         research_fields = []
-        for research_field in article.get_research_fields():
+        # Iterate the manager directly instead of get_research_fields(); a
+        # .values() call on the related manager always hits the database and
+        # would bypass the prefetch cache populated by the list queries.
+        for research_field in article.research_fields.all():
             research_fields.append(
                 ResearchField(
-                    id=research_field["research_field_id"],
-                    label=research_field["label"],
+                    id=research_field.research_field_id,
+                    label=research_field.label,
                     # related_identifier=research_field.related_identifier,
-                    research_field_id=research_field["research_field_id"],
+                    research_field_id=research_field.research_field_id,
                 )
             )
 
@@ -16,18 +16,19 @@ class SQLResearchFieldRepository(ResearchFieldRepository):
         self, search_query: str, page: int, page_size: int
     ) -> List[ResearchField]:
         try:
-            research_fields_queryset = ResearchFieldModel.objects.filter(
-                label__icontains=search_query
-            ).order_by("label")[:5]
-            research_fields = []
-            for research_model in research_fields_queryset:
-                research_field = ResearchField(
-                    id=research_model.id,
-                    label=research_model.label,
-                    research_field_id=research_model.research_field_id,
+            rf_rows = (
+                ResearchFieldModel.objects.filter(label__icontains=search_query)
+                .order_by("label")
+                .values("id", "label", "research_field_id")[:5]
+            )
+            return [
+                ResearchField(
+                    id=row["id"],
+                    label=row["label"],
+                    research_field_id=row["research_field_id"],
                 )
-                research_fields.append(research_field)
-            return research_fields
+                for row in rf_rows
+            ]
 
         except Exception as e:
             logger.error(f"Error in get_research_fields_by_name: {str(e)}")
@@ -43,21 +44,21 @@ class SQLResearchFieldRepository(ResearchFieldRepository):
 
     def find_by_label(self, label: str) -> List[ResearchField]:
         try:
-            rf_queryset = ResearchFieldModel.objects.filter(
-                label__icontains=label
-            ).order_by("label")[:5]
+            rf_rows = (
+                ResearchFieldModel.objects.filter(label__icontains=label)
+                .order_by("label")
+                .values("id", "label", "research_field_id", "related_identifier")[:5]
+            )
 
-            research_fields = []
-            for rf_model in rf_queryset:
-                research_field = ResearchField(
-                    id=rf_model.id,
-                    label=rf_model.label,
-                    research_field_id=rf_model.research_field_id,
-                    related_identifier=rf_model.related_identifier,
+            return [
+                ResearchField(
+                    id=row["id"],
+                    label=row["label"],
+                    research_field_id=row["research_field_id"],
+                    related_identifier=row["related_identifier"],
                 )
-                research_fields.append(research_field)
-
-            return research_fields
+                for row in rf_rows
+            ]
 
         except Exception as e:
             logger.error(f"Error in find_by_label: {str(e)}")
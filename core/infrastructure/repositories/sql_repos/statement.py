@@ -9,10 +9,11 @@ from core.infrastructure.models.sql_models import (
     Article as ArticleModel,
     Statement as StatementModel,
     Author as AuthorModel,
+    HasPart as HasPartModel,
 )
 from django.core.paginator import Paginator
 from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
-from django.db.models import F, Case, When
+from django.db.models import F, Case, When, Prefetch, Window, Count
 
 from core.infrastructure.repositories.sql_repos_helper import generate_static_id
 
@@ -24,14 +25,38 @@ class SQLStatementRepository(StatementRepository):
         self, page: int = 1, page_size: int = 10
     ) -> Tuple[List[Statement], int]:
         try:
-            queryset = StatementModel.objects.all().order_by("id")
-            total = queryset.count()
-
-            paginator = Paginator(queryset, page_size)
-            page_obj = paginator.get_page(page)
+            queryset = (
+                StatementModel.objects.all()
+                .select_related("article__publisher")
+                .prefetch_related(
+                    "authors", "article__authors", "article__concepts"
+                )
+                .order_by("id")
+            )
+            # COUNT(*) OVER () returns the total with the page rows, saving
+            # the separate COUNT query the paginator would have issued.
+            if page < 1:
+                page = 1
+            offset = (page - 1) * page_size
+            rows = list(
+                queryset.annotate(total=Window(expression=Count("pk")))[
+                    offset : offset + page_size
+                ]
+            )
+            if rows:
+                total = rows[0].total
+            else:
+                # Out-of-range page: clamp to the last page like
+                # Paginator.get_page used to. Costs an exact COUNT plus a
+                # re-fetch, but only on the rare over-shot request.
+                total = queryset.count()
+                if total:
+                    last_page = max((total + page_size - 1) // page_size, 1)
+                    offset = (last_page - 1) * page_size
+                    rows = list(queryset[offset : offset + page_size])
 
             statements = []
-            for statement_model in page_obj:
+            for statement_model in rows:
                 statement = self._convert_statement_to_entity(statement_model)
                 statements.append(statement)
 
@@ -79,9 +104,39 @@ class SQLStatementRepository(StatementRepository):
 
     def find_by_id(self, statement_id: str) -> Optional[Statement]:
         try:
-            statement_model = StatementModel.objects.filter(
-                statement_id=statement_id
-            ).first()
+            # statement_data_type walks the full component/input/output tree;
+            # prefetching it here turns that traversal into a fixed number of
+            # queries instead of one per nested collection. Subclass-specific
+            # relations of the polymorphic DataType (targets, level,
+            # evaluate) cannot be prefetched from the parent and stay lazy.
+            statement_model = (
+                StatementModel.objects.filter(statement_id=statement_id)
+                .prefetch_related(
+                    "authors",
+                    "concepts",
+                    "components__units",
+                    "components__properties",
+                    "components__matrices",
+                    "components__object_of_interests",
+                    "implement_statements",
+                    "data_type_statement__schema_type",
+                    "data_type_statement__executes__part_of__part_of",
+                    "data_type_statement__has_inputs__has_characteristic",
+                    "data_type_statement__has_inputs__has_expression",
+                    "data_type_statement__has_inputs__has_part",
+                    "data_type_statement__has_outputs__has_characteristic",
+                    "data_type_statement__has_outputs__has_expression",
+                    "data_type_statement__has_outputs__has_part",
+                    Prefetch(
+                        "has_part_statements",
+                        queryset=HasPartModel.objects.order_by("id").select_related(
+                            "schema_type"
+                        ),
+                        to_attr="prefetched_has_parts",
+                    ),
+                )
+                .first()
+            )
 
             return statement_model
 
@@ -91,7 +146,11 @@ class SQLStatementRepository(StatementRepository):
 
     def find_by_paper_id(self, paper_id: str) -> List[Statement]:
         try:
-            statements_queryset = StatementModel.objects.filter(article_id=paper_id)
+            statements_queryset = (
+                StatementModel.objects.filter(article_id=paper_id)
+                .select_related("article__publisher")
+                .prefetch_related("authors", "article__authors", "article__concepts")
+            )
 
             statements = []
             for statement_model in statements_queryset:
@@ -317,6 +376,9 @@ class SQLStatementRepository(StatementRepository):
                 else:
                     query = query.order_by("label")
 
+            query = query.select_related("article__publisher").prefetch_related(
+                "authors", "article__authors", "article__concepts"
+            )
             total = query.count()
             paginator = Paginator(query, page_size)
             page_obj = paginator.get_page(page)
@@ -339,7 +401,11 @@ class SQLStatementRepository(StatementRepository):
         page_size: int = 10,
     ) -> Tuple[List[Statement], int]:
         try:
-            query = StatementModel.objects.filter(id__in=ids).select_related("article")
+            query = (
+                StatementModel.objects.filter(id__in=ids)
+                .select_related("article__publisher")
+                .prefetch_related("authors", "article__authors", "article__concepts")
+            )
 
             if sort_order == "a-z":
                 query = query.order_by("article__name")
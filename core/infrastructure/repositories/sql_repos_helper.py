@@ -65,16 +65,16 @@ def process_source_code_content_flexible(content_file, filename, article_id=None
             modified_content = re.sub(csv_link_pattern, replace_csv_link, text_content)
 
             if modified_content != text_content:
-                print(f"Modified {filename} - replaced CSV links")
+                logger.debug("Modified %s - replaced CSV links", filename)
                 if isinstance(content, bytes):
                     modified_content = modified_content.encode("utf-8")
                 return ContentFile(modified_content, name=filename)
 
         except Exception as e:
-            print(f"Error processing content: {e}")
+            logger.warning("Error processing content: %s", e)
 
     except Exception as e:
-        print(f"Error: {e}")
+        logger.warning("Error reading source code content: %s", e)
 
     content_file.seek(0)
     return content_file
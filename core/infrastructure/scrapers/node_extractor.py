@@ -1,5 +1,7 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import time
 import uuid
@@ -15,6 +17,30 @@ logger = logging.getLogger(__name__)
 mimetypes.add_type("application/x-python", ".py")
 mimetypes.add_type("text/x-r", ".r")
 
+# One session shared by every extractor instance: extractors are created per
+# extraction (they carry per-call state like url/soup/doi), but the pooled
+# connections and TLS handshakes should be reused across extractions.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=100,
+    max_retries=Retry(
+        total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)
+    ),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+_session.headers.update(
+    {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Cache-Control": "max-age=0",
+    }
+)
+
 
 class NodeExtractor:
     def __init__(self):
@@ -22,18 +48,7 @@ class NodeExtractor:
         self.metadata = ""
         self.soup = None
         self.doi = ""
-        self.session = requests.Session()
-
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Cache-Control": "max-age=0",
-            }
-        )
+        self.session = _session
 
     def set_url(self, url: str) -> None:
         self.url = url
@@ -56,13 +71,13 @@ class NodeExtractor:
         parsed_url = urlparse(url)
         filename = os.path.basename(parsed_url.path)
         if not parsed_url.netloc.endswith(allowed_domain):
-            print(f"Blocked download from unauthorized domain: {parsed_url.netloc}")
-            print(f"Only downloads from {allowed_domain} are allowed")
+            logger.warning("Blocked download from unauthorized domain: %s", parsed_url.netloc)
+            logger.warning("Only downloads from %s are allowed", allowed_domain)
             return filename, None, None, False, 0
 
         if parsed_url.scheme != "https":
-            print(f"Blocked non-HTTPS URL: {url}")
-            print("Only HTTPS URLs are allowed")
+            logger.warning("Blocked non-HTTPS URL: %s", url)
+            logger.warning("Only HTTPS URLs are allowed")
             return filename, None, None, False, 0
 
         mime_type, _ = mimetypes.guess_type(filename)
@@ -89,12 +104,15 @@ class NodeExtractor:
 
                 if file_size > max_size_bytes:
                     # File is too large, return metadata only
-                    print(
-                        f"File {filename} is {file_size_mb:.2f}MB, exceeds {max_size_mb}MB limit"
+                    logger.info(
+                        "File %s is %.2fMB, exceeds %sMB limit",
+                        filename,
+                        file_size_mb,
+                        max_size_mb,
                     )
                     return filename, None, mime_type, True, file_size_mb
         except Exception as e:
-            print(f"Could not check file size via HEAD request: {e}")
+            logger.debug("Could not check file size via HEAD request: %s", e)
 
         try:
             response = requests.get(url, stream=True, timeout=30)
@@ -107,8 +125,11 @@ class NodeExtractor:
                 file_size_mb = file_size / (1024 * 1024)
 
                 if file_size > max_size_bytes:
-                    print(
-                        f"File {filename} is {file_size_mb:.2f}MB, exceeds {max_size_mb}MB limit"
+                    logger.info(
+                        "File %s is %.2fMB, exceeds %sMB limit",
+                        filename,
+                        file_size_mb,
+                        max_size_mb,
                     )
                     return filename, None, mime_type, True, file_size_mb
 
@@ -120,8 +141,11 @@ class NodeExtractor:
                     downloaded_size += len(chunk)
                     if downloaded_size > max_size_bytes:
                         file_size_mb = downloaded_size / (1024 * 1024)
-                        print(
-                            f"File {filename} exceeded {max_size_mb}MB limit during download ({file_size_mb:.2f}MB)"
+                        logger.info(
+                            "File %s exceeded %sMB limit during download (%.2fMB)",
+                            filename,
+                            max_size_mb,
+                            file_size_mb,
                         )
                         return filename, None, mime_type, True, file_size_mb
                     chunks.append(chunk)
@@ -129,11 +153,11 @@ class NodeExtractor:
             content = b"".join(chunks)
             file_size_mb = downloaded_size / (1024 * 1024)
             content_file = ContentFile(content, name=filename)
-            print(f"Successfully downloaded {filename} ({file_size_mb:.2f}MB)")
+            logger.debug("Successfully downloaded %s (%.2fMB)", filename, file_size_mb)
             return filename, content_file, mime_type, False, file_size_mb
 
         except Exception as e:
-            print(f"Error downloading file {filename}: {e}")
+            logger.error("Error downloading file %s: %s", filename, e)
             raise
 
     def all_json_files(self) -> Dict[str, str]:
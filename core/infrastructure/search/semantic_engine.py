@@ -6,10 +6,62 @@ import json
 import gc
 import os
 import logging
+import threading
 import torch
 
 logger = logging.getLogger(__name__)
 
+# The encoder truncates to its sequence cap anyway (384 tokens for
+# mpnet), so bytes past roughly this point only cost tokenizer time
+# before being dropped. Capping up front keeps long abstracts from
+# dominating index builds.
+ENCODE_CHAR_CAP = 2000
+
+_model_lock = threading.Lock()
+_models: Dict[str, SentenceTransformer] = {}
+_torch_threads_configured = False
+
+
+def _configure_torch_threads() -> None:
+    """Bound torch's intra-op pool to the useful core count.
+
+    PyTorch defaults to one thread per visible core, which oversubscribes
+    workers running under a cgroup CPU quota; 4-8 threads is the sweet
+    spot for sentence-transformer encoding on CPU. Interop threads can
+    only be set before the first parallel op, so this runs once, ahead of
+    the first model load.
+    """
+    global _torch_threads_configured
+    if _torch_threads_configured:
+        return
+    try:
+        torch.set_num_threads(min(os.cpu_count() or 1, 8))
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Parallel work already started somewhere else in the process;
+        # keep whatever the runtime chose.
+        pass
+    _torch_threads_configured = True
+
+
+def get_sentence_transformer(model_name: str, device: str = "cpu") -> SentenceTransformer:
+    """Process-wide cache of loaded sentence-transformer models.
+
+    Loading pulls hundreds of megabytes of weights from disk and warms
+    the tokenizer; every engine constructed in a worker shares one
+    instance per (model, device) instead of re-loading.
+    """
+    key = f"{model_name}:{device}"
+    model = _models.get(key)
+    if model is None:
+        with _model_lock:
+            model = _models.get(key)
+            if model is None:
+                _configure_torch_threads()
+                model = SentenceTransformer(model_name, device=device)
+                _models[key] = model
+    return model
+
 
 class SemanticSearchEngine:
     def __init__(
@@ -23,7 +75,7 @@ class SemanticSearchEngine:
         base_path: str = "data",
     ):
         os.environ["CUDA_VISIBLE_DEVICES"] = ""
-        self.model = SentenceTransformer(model_name, device="cpu")
+        self.model = get_sentence_transformer(model_name)
         self.batch_size = batch_size
         self.use_gpu = use_gpu
         self.articles_index_name = articles_index_name
@@ -41,14 +93,16 @@ class SemanticSearchEngine:
         self._load_indices()
 
     def _encode_texts(self, texts: List[str]) -> np.ndarray:
-        embeddings_list = []
-        for i in range(0, len(texts), self.batch_size):
-            batch_texts = texts[i : i + self.batch_size]
-            batch_embeddings = self.model.encode(
-                batch_texts, show_progress_bar=True, device="cpu"
-            )
-            embeddings_list.append(batch_embeddings)
-        return np.vstack(embeddings_list)
+        # encode() sorts the whole list by token length and batches
+        # similar-length texts together, so each minibatch only pads to
+        # its own longest member. Pre-chunking into fixed slices here
+        # defeated that and padded every batch to its longest outlier.
+        return self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            show_progress_bar=True,
+            device="cpu",
+        )
 
     def _load_indices(self) -> None:
         try:
@@ -142,7 +196,7 @@ class SemanticSearchEngine:
             self.articles.extend(valid_articles)
 
             texts = [
-                f"{article['title']} {article['abstract']}"
+                f"{article['title']} {article['abstract']}"[:ENCODE_CHAR_CAP]
                 for article in valid_articles
             ]
 
@@ -187,7 +241,7 @@ class SemanticSearchEngine:
             self.statements.extend(valid_statements)
 
             texts = [
-                f"{statement['text']} {statement.get('abstract', '')}"
+                f"{statement['text']} {statement.get('abstract', '')}"[:ENCODE_CHAR_CAP]
                 for statement in valid_statements
             ]
 
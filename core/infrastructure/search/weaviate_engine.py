@@ -5,7 +5,10 @@ import weaviate
 from weaviate.exceptions import WeaviateConnectionError
 import numpy as np
 from typing import List, Dict, Any, Optional
-from sentence_transformers import SentenceTransformer
+from core.infrastructure.search.semantic_engine import (
+    ENCODE_CHAR_CAP,
+    get_sentence_transformer,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +32,7 @@ class WeaviateSearchEngine:
         self.statements_class_name = statements_class_name
         self.use_batch = use_batch
         self.batch_size = batch_size
-        self.model = SentenceTransformer(model_name, device="cpu")
+        self.model = get_sentence_transformer(model_name)
         self.client: Optional[weaviate.WeaviateClient] = None
         if auto_connect:
             self.initialize_client()
@@ -223,7 +226,7 @@ class WeaviateSearchEngine:
                 return
 
             texts = [
-                f"{article['title']} {article['abstract']}"
+                f"{article['title']} {article['abstract']}"[:ENCODE_CHAR_CAP]
                 for article in valid_articles
             ]
 
@@ -294,7 +297,7 @@ class WeaviateSearchEngine:
                 return
 
             texts = [
-                f"{statement['label']} {statement.get('content', '')}"
+                f"{statement['label']} {statement.get('content', '')}"[:ENCODE_CHAR_CAP]
                 for statement in valid_statements
             ]
             embeddings = self._encode_texts(texts)
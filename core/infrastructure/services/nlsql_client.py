@@ -46,7 +46,7 @@ class NLSQLClientService:
             settings, "DUCKDB_DATABASE_PATH", "data/nlsql_database.db"
         )
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        print(os.path.dirname(self.db_path))
+        logger.debug("DuckDB database directory: %s", os.path.dirname(self.db_path))
 
         self.db_conn = None
 
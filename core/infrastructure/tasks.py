@@ -10,8 +10,8 @@ from core.application.interfaces.repositories import SearchRepository
 logger = logging.getLogger(__name__)
 
 
-@shared_task(name="extract_paper_task")
-def extract_paper_task(url: str) -> Dict[str, Any]:
+@shared_task(bind=True, name="extract_paper_task", max_retries=3)
+def extract_paper_task(self, url: str) -> Dict[str, Any]:
     try:
         logger.info(f"Starting paper extraction from URL: {url}")
 
@@ -38,7 +38,16 @@ def extract_paper_task(url: str) -> Dict[str, Any]:
 
     except Exception as e:
         logger.error(f"Exception in extract_paper_task for URL {url}: {str(e)}")
-        return {"success": False, "message": f"An error occurred: {str(e)}", "url": url}
+        # Scraping failures are usually transient network errors; retry with
+        # a growing delay before giving up.
+        try:
+            raise self.retry(exc=e, countdown=30 * (self.request.retries + 1))
+        except self.MaxRetriesExceededError:
+            return {
+                "success": False,
+                "message": f"An error occurred: {str(e)}",
+                "url": url,
+            }
 
 
 @shared_task(name="batch_extract_papers_task")
@@ -269,17 +269,17 @@ class Command(BaseCommand):
             self.style.SUCCESS(f"Found {total} articles to index in Weaviate")
         )
 
-        batches = (total // batch_size) + (1 if total % batch_size > 0 else 0)
-
         start_time = time.time()
         indexed_count = 0
-        for batch in tqdm(range(batches), desc="Indexing article batches"):
-            offset = batch * batch_size
-            articles_batch = queryset[offset : offset + batch_size]
-
-            articles_data = []
-            for article in articles_batch:
-                article_data = {
+        batch = 0
+        articles_data = []
+        for article in tqdm(
+            queryset.iterator(chunk_size=batch_size),
+            total=total,
+            desc="Indexing articles",
+        ):
+            articles_data.append(
+                {
                     "article_id": article.article_id,
                     "title": article.name,
                     "abstract": article.abstract or "",
@@ -287,21 +287,27 @@ class Command(BaseCommand):
                     if article.updated_at
                     else None,
                 }
-                articles_data.append(article_data)
+            )
 
-            if articles_data:
+            if len(articles_data) >= batch_size:
                 search_repo.add_articles(articles_data)
                 indexed_count += len(articles_data)
-
-            if (batch + 1) % 10 == 0 or batch == batches - 1:
-                elapsed = time.time() - start_time
-                items_per_sec = indexed_count / elapsed if elapsed > 0 else 0
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Indexed {indexed_count}/{total} articles "
-                        f"({items_per_sec:.2f} items/sec)"
+                articles_data = []
+                batch += 1
+
+                if batch % 10 == 0:
+                    elapsed = time.time() - start_time
+                    items_per_sec = indexed_count / elapsed if elapsed > 0 else 0
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"Indexed {indexed_count}/{total} articles "
+                            f"({items_per_sec:.2f} items/sec)"
+                        )
                     )
-                )
+
+        if articles_data:
+            search_repo.add_articles(articles_data)
+            indexed_count += len(articles_data)
 
         elapsed = time.time() - start_time
         items_per_sec = indexed_count / elapsed if elapsed > 0 else 0
@@ -430,20 +436,20 @@ class Command(BaseCommand):
             self.style.SUCCESS(f"Found {total} statements to index in Weaviate")
         )
 
-        batches = (total // batch_size) + (1 if total % batch_size > 0 else 0)
-
         start_time = time.time()
         indexed_count = 0
-
-        for batch in tqdm(range(batches), desc="Indexing statement batches"):
-            offset = batch * batch_size
-            statements_batch = queryset[offset : offset + batch_size]
-
-            statements_data = []
-            for statement in statements_batch:
-                data_type = paper_service.statement_data_type(statement)
-                long_string = self._statement_data_info(data_type)
-                statement_data = {
+        batch = 0
+        statements_data = []
+
+        for statement in tqdm(
+            queryset.iterator(chunk_size=batch_size),
+            total=total,
+            desc="Indexing statements",
+        ):
+            data_type = paper_service.statement_data_type(statement)
+            long_string = self._statement_data_info(data_type)
+            statements_data.append(
+                {
                     "statement_id": statement.statement_id,
                     "label": statement.label,
                     "content": long_string,
@@ -451,21 +457,27 @@ class Command(BaseCommand):
                     if statement.updated_at
                     else None,
                 }
-                statements_data.append(statement_data)
+            )
 
-            if statements_data:
+            if len(statements_data) >= batch_size:
                 search_repo.add_statements(statements_data)
                 indexed_count += len(statements_data)
-
-            if (batch + 1) % 10 == 0 or batch == batches - 1:
-                elapsed = time.time() - start_time
-                items_per_sec = indexed_count / elapsed if elapsed > 0 else 0
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Indexed {indexed_count}/{total} statements "
-                        f"({items_per_sec:.2f} items/sec)"
+                statements_data = []
+                batch += 1
+
+                if batch % 10 == 0:
+                    elapsed = time.time() - start_time
+                    items_per_sec = indexed_count / elapsed if elapsed > 0 else 0
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"Indexed {indexed_count}/{total} statements "
+                            f"({items_per_sec:.2f} items/sec)"
+                        )
                     )
-                )
+
+        if statements_data:
+            search_repo.add_statements(statements_data)
+            indexed_count += len(statements_data)
 
         elapsed = time.time() - start_time
         items_per_sec = indexed_count / elapsed if elapsed > 0 else 0
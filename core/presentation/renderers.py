@@ -0,0 +1,20 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+
+
+class ORJSONRenderer(BaseRenderer):
+    """JSON renderer backed by orjson.
+
+    orjson writes straight to bytes and handles datetime/UUID natively,
+    which is markedly faster than the stdlib encoder on the large nested
+    payloads the insight and paper endpoints return.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
@@ -13,7 +13,7 @@ from core.application.dtos.input_dtos import (
 import logging
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
-from rest_framework.renderers import JSONRenderer
+from core.presentation.renderers import ORJSONRenderer
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +23,7 @@ class AutoCompleteViewSet(viewsets.GenericViewSet):
     pagination_class = None
     queryset = []
     serializer_class = None
-    renderer_classes = [JSONRenderer]
+    renderer_classes = [ORJSONRenderer]
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
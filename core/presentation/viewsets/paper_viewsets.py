@@ -31,7 +31,9 @@ from core.presentation.serializers.paper_serializers import (
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 import logging
-from rest_framework.renderers import JSONRenderer
+from celery.result import AsyncResult
+from core.infrastructure.tasks import extract_paper_task
+from core.presentation.renderers import ORJSONRenderer
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +43,7 @@ class PaperViewSet(viewsets.GenericViewSet):
     pagination_class = None
     queryset = []
     serializer_class = PaperSerializer
-    renderer_classes = [JSONRenderer]
+    renderer_classes = [ORJSONRenderer]
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -158,7 +160,7 @@ class PaperViewSet(viewsets.GenericViewSet):
             per_page=request.query_params.get("per_page", 10),
         )
         result = self.paper_service.query_data(filter_dto)
-        return result
+        return Response(result)
 
         # except Exception as e:
         #     logger.error(f"Error in query_data: {str(e)}")
@@ -765,16 +767,15 @@ class PaperViewSet(viewsets.GenericViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            url_dto = ScraperUrlInputDTO(url=serializer.validated_data["url"])
-            result = self.paper_service.extract_paper(url_dto)
+            # Scraping and ingestion are high-variance network work; hand
+            # them to Celery so the request returns immediately with a task
+            # id that can be polled via extraction_status.
+            task = extract_paper_task.delay(serializer.validated_data["url"])
 
-            if not result.success:
-                return Response(
-                    {"error": result.message or "Failed to extract paper"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            return Response({"result": True})
+            return Response(
+                {"result": True, "task_id": task.id},
+                status=status.HTTP_202_ACCEPTED,
+            )
 
         except Exception as e:
             logger.error(f"Error in add_paper: {str(e)}")
@@ -783,6 +784,22 @@ class PaperViewSet(viewsets.GenericViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @action(detail=False, methods=["get"], url_path="extraction_status/(?P<task_id>[^/.]+)")
+    def extraction_status(self, request: Request, task_id: str = None) -> Response:
+        try:
+            task_result = AsyncResult(task_id)
+            payload = {"task_id": task_id, "state": task_result.state}
+            if task_result.ready():
+                payload["result"] = task_result.result
+            return Response(payload)
+
+        except Exception as e:
+            logger.error(f"Error in extraction_status: {str(e)}")
+            return Response(
+                {"error": "Failed to read task status"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
     @action(detail=False, methods=["post"])
     def add_all_papers(self, request: Request) -> Response:
         try:
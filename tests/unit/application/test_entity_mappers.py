@@ -0,0 +1,72 @@
+import numpy as np
+
+from core.application.mappers.entity_mappers import PaperMapper, _as_list
+
+
+class TestAsList:
+    def test_list_passes_through(self):
+        assert _as_list([1, 2]) == [1, 2]
+
+    def test_scalar_is_wrapped(self):
+        assert _as_list("value") == ["value"]
+        assert _as_list({"id": "a1"}) == [{"id": "a1"}]
+
+    def test_falsy_becomes_empty_list(self):
+        assert _as_list(None) == []
+        assert _as_list("") == []
+
+    def test_empty_list_stays_empty(self):
+        assert _as_list([]) == []
+
+
+class TestFromDictsColumnar:
+    def test_columns_line_up_with_rows(self):
+        rows = [
+            {
+                "id": "paper1",
+                "title": "First Paper",
+                "abstract": "First abstract",
+                "date_published": "2023-01-15",
+                "author": [{"label": "John Doe"}],
+            },
+            {
+                "_id": "paper2",
+                "name": "Second Paper",
+                "abstract": "Second abstract",
+                "date_published": "2023-06-01T12:00:00Z",
+                "author": {"given_name": "Jane", "family_name": "Roe"},
+            },
+        ]
+
+        columns = PaperMapper.from_dicts_columnar(rows)
+
+        assert list(columns["id"]) == ["paper1", "paper2"]
+        assert list(columns["title"]) == ["First Paper", "Second Paper"]
+        assert list(columns["abstract"]) == ["First abstract", "Second abstract"]
+        assert columns["date_published"][0] == np.datetime64("2023-01-15T00:00:00")
+        assert columns["date_published"][1] == np.datetime64("2023-06-01T12:00:00")
+        assert columns["author_labels"][0] == ["John Doe"]
+        assert columns["author_labels"][1] == ["Jane Roe"]
+
+    def test_missing_and_bad_dates_become_nat(self):
+        rows = [
+            {"id": "paper1", "title": "No Date", "author": []},
+            {
+                "id": "paper2",
+                "title": "Bad Date",
+                "date_published": "not-a-date",
+                "author": [],
+            },
+        ]
+
+        columns = PaperMapper.from_dicts_columnar(rows)
+
+        assert np.isnat(columns["date_published"][0])
+        assert np.isnat(columns["date_published"][1])
+
+    def test_empty_input_yields_empty_columns(self):
+        columns = PaperMapper.from_dicts_columnar([])
+
+        assert len(columns["id"]) == 0
+        assert len(columns["title"]) == 0
+        assert len(columns["date_published"]) == 0
@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime
 
-from core.application.services.paper_service import PaperServiceImpl
+from core.application.services.paper_service import PaperServiceImpl, _cache_key
 from core.application.dtos.input_dtos import QueryFilterInputDTO, ScraperUrlInputDTO
 from core.application.dtos.output_dtos import (
     PaperOutputDTO,
@@ -274,3 +274,31 @@ class TestPaperService:
             paper_service.get_all_papers(page=1, page_size=10)
 
         assert "Test error" in str(excinfo.value)
+
+
+class TestCacheKey:
+    def test_same_parts_same_key(self):
+        key_a = _cache_key("papers", title="Test", page=1)
+        key_b = _cache_key("papers", title="Test", page=1)
+
+        assert key_a == key_b
+
+    def test_list_order_is_canonicalized(self):
+        key_a = _cache_key("papers", research_fields=["rf2", "rf1"])
+        key_b = _cache_key("papers", research_fields=["rf1", "rf2"])
+
+        assert key_a == key_b
+
+    def test_different_values_change_the_key(self):
+        key_a = _cache_key("papers", title="Test", page=1)
+        key_b = _cache_key("papers", title="Test", page=2)
+
+        assert key_a != key_b
+
+    def test_prefix_separates_namespaces(self):
+        key_a = _cache_key("papers", page=1)
+        key_b = _cache_key("statements", page=1)
+
+        assert key_a.startswith("papers:")
+        assert key_b.startswith("statements:")
+        assert key_a != key_b
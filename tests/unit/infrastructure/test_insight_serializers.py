@@ -0,0 +1,92 @@
+from core.infrastructure.repositories.sql_repos.insight_serializers import (
+    ComponentRecord,
+    first_or,
+    serialize_component,
+    serialize_related,
+)
+
+
+class TestFirstOr:
+    def test_prefers_exact_match(self):
+        assert first_or(["exact"], ["close"]) == "exact"
+
+    def test_falls_back_to_close_match(self):
+        assert first_or([], ["close"]) == "close"
+
+    def test_empty_when_nothing_matches(self):
+        assert first_or([], []) == ""
+
+
+class TestSerializeRelated:
+    def test_picks_label_and_see_also_per_row(self):
+        rows = [
+            {"label": ["Sum"], "exact_match": ["http://a"], "close_match": []},
+            {"label": ["Mean"], "exact_match": [], "close_match": ["http://b"]},
+        ]
+
+        assert serialize_related(rows) == [
+            {"label": "Sum", "see_also": "http://a"},
+            {"label": "Mean", "see_also": "http://b"},
+        ]
+
+
+class TestSerializeComponent:
+    def _component(self, type_label, **overrides):
+        component = {
+            "id": 1,
+            "type": [type_label],
+            "label": "['accuracy']",
+            "string_match": ["Accuracy"],
+            "usage_count": 3,
+            "exact_match": ["http://exact"],
+            "close_match": ["http://close"],
+        }
+        component.update(overrides)
+        return component
+
+    def test_measure_component_skips_related_lookups(self):
+        record = serialize_component(self._component("Measure"), related={})
+
+        assert isinstance(record, ComponentRecord)
+        assert record.text == "Accuracy"
+        assert record.label == "Accuracy"
+        assert record.definition == "accuracy"
+        assert record.value == 3
+        assert record.see_also == "http://exact"
+        assert record.operations == []
+        assert record.units == []
+
+    def test_other_component_serializes_related_rows(self):
+        related = {
+            "operations": {
+                1: [{"label": ["Sum"], "exact_match": ["http://op"], "close_match": []}]
+            },
+            "matrices": {1: []},
+            "object_of_interests": {1: []},
+            "properties": {1: []},
+            "units": {1: []},
+        }
+
+        record = serialize_component(self._component("Variable"), related=related)
+
+        assert record.see_also == ["http://exact"]
+        assert record.operations == [{"label": "Sum", "see_also": "http://op"}]
+        assert record.matrices == []
+
+    def test_close_match_fallback_when_no_exact_match(self):
+        related = {
+            name: {1: []}
+            for name in (
+                "operations",
+                "matrices",
+                "object_of_interests",
+                "properties",
+                "units",
+            )
+        }
+
+        record = serialize_component(
+            self._component("Variable", exact_match=[]), related=related
+        )
+
+        assert record.see_also == ["http://close"]
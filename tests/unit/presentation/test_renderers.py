@@ -0,0 +1,44 @@
+import uuid
+from datetime import datetime
+
+import numpy as np
+import orjson
+import pytest
+
+from core.presentation.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer:
+    def test_renders_nested_payload_to_bytes(self):
+        renderer = ORJSONRenderer()
+
+        rendered = renderer.render({"papers": [{"id": "p1", "count": 2}]})
+
+        assert isinstance(rendered, bytes)
+        assert orjson.loads(rendered) == {"papers": [{"id": "p1", "count": 2}]}
+
+    def test_none_renders_to_empty_body(self):
+        assert ORJSONRenderer().render(None) == b""
+
+    def test_handles_datetime_uuid_and_numpy(self):
+        payload = {
+            "created_at": datetime(2023, 1, 1, 12, 0, 0),
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "scores": np.array([0.5, 1.0]),
+        }
+
+        decoded = orjson.loads(ORJSONRenderer().render(payload))
+
+        assert decoded["created_at"] == "2023-01-01T12:00:00"
+        assert decoded["id"] == "12345678-1234-5678-1234-567812345678"
+        assert decoded["scores"] == [0.5, 1.0]
+
+    def test_rejects_lazy_objects(self):
+        # orjson has no fallback for arbitrary iterables, which is why the
+        # repositories materialize QuerySets with list() before returning.
+        class LazyRows:
+            def __iter__(self):
+                return iter([{"id": "p1"}])
+
+        with pytest.raises(TypeError):
+            ORJSONRenderer().render({"rows": LazyRows()})